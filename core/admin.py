@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import Profile, Skill, Project, Experience, Education, Certification, Contact
+from . import spam
+from .models import Profile, Skill, Project, Experience, Education, Certification, Contact, NotificationDelivery
 
 
 @admin.register(Profile)
@@ -51,13 +52,13 @@ class CertificationAdmin(admin.ModelAdmin):
 
 @admin.register(Contact)
 class ContactAdmin(admin.ModelAdmin):
-    list_display = ['name', 'email', 'subject', 'created_at', 'is_read']
-    list_filter = ['is_read', 'created_at']
+    list_display = ['name', 'email', 'subject', 'created_at', 'is_read', 'is_spam']
+    list_filter = ['is_read', 'is_spam', 'created_at']
     search_fields = ['name', 'email', 'subject', 'message']
     readonly_fields = ['created_at']
     ordering = ['-created_at']
     
-    actions = ['mark_as_read', 'mark_as_unread']
+    actions = ['mark_as_read', 'mark_as_unread', 'mark_as_spam', 'mark_as_not_spam']
     
     def mark_as_read(self, request, queryset):
         updated = queryset.update(is_read=True)
@@ -69,5 +70,32 @@ class ContactAdmin(admin.ModelAdmin):
         self.message_user(request, f'{updated} contact(s) marked as unread.')
     mark_as_unread.short_description = "Mark selected contacts as unread"
     
+    def mark_as_spam(self, request, queryset):
+        updated = queryset.update(is_spam=True)
+        self.message_user(request, f'{updated} contact(s) marked as spam.{self.retrain()}')
+    mark_as_spam.short_description = "Mark selected contacts as spam"
+    
+    def mark_as_not_spam(self, request, queryset):
+        updated = queryset.update(is_spam=False)
+        self.message_user(request, f'{updated} contact(s) marked as not spam.{self.retrain()}')
+    mark_as_not_spam.short_description = "Mark selected contacts as not spam"
+    
+    def retrain(self):
+        """Retrain the spam filter's naive Bayes model, if it is used"""
+        if not spam.spam_settings()['BAYES']:
+            return ''
+        if spam.train() is None:
+            return ' Not enough marked contacts to train the spam filter yet.'
+        return ' Spam filter retrained.'
+    
     def get_queryset(self, request):
         return super().get_queryset(request).select_related()
+
+
+@admin.register(NotificationDelivery)
+class NotificationDeliveryAdmin(admin.ModelAdmin):
+    list_display = ['contact', 'channel', 'status', 'attempt', 'latency_ms', 'error_class', 'created_at']
+    list_filter = ['channel', 'status', 'error_class', 'created_at']
+    search_fields = ['provider_message_id', 'contact__email']
+    raw_id_fields = ['contact']
+    ordering = ['-created_at']
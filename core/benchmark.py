@@ -0,0 +1,151 @@
+"""
+Helpers for the ``benchmark`` management command: latency percentiles and
+comparison of a results file against the committed baseline.
+
+Results are nested as ``{dataset size: {endpoint: metrics}}`` where metrics
+holds ``p50_ms``, ``p95_ms``, ``max_ms``, ``queries_p50``, ``queries_max``
+and ``peak_memory_kb``. The ``import_time`` entry holds the cost of
+importing the WSGI module (which loads settings, every installed app and
+the middleware) as measured by ``python -X importtime``.
+"""
+import json
+import math
+import os
+import subprocess
+import sys
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of ``samples`` (``fraction`` between 0 and 1)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(latencies_ms, query_counts, peak_memory_bytes):
+    """Reduce raw per-iteration samples to the metrics stored in results files"""
+    return {
+        'p50_ms': round(percentile(latencies_ms, 0.50), 3),
+        'p95_ms': round(percentile(latencies_ms, 0.95), 3),
+        'max_ms': round(max(latencies_ms, default=0.0), 3),
+        'queries_p50': percentile(query_counts, 0.50),
+        'queries_max': max(query_counts, default=0),
+        'peak_memory_kb': round(peak_memory_bytes / 1024, 1),
+    }
+
+
+def load_results(path):
+    with open(path) as results_file:
+        return json.load(results_file)
+
+
+def write_results(path, results):
+    with open(path, 'w') as results_file:
+        json.dump(results, results_file, indent=2, sort_keys=True)
+        results_file.write('\n')
+
+
+def parse_importtime(output):
+    """
+    Parse ``-X importtime`` output into ``(module, depth, self_us,
+    cumulative_us)`` tuples, in the order the imports finished.
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            continue  # the header row
+        module = name.lstrip()
+        depth = (len(name) - len(module) - 1) // 2
+        imports.append((module, depth, self_us, cumulative_us))
+    return imports
+
+
+def summarize_imports(imports, module, top=10):
+    """
+    Total import time of ``module`` and the ``top`` most expensive imports
+    made while it was being imported.
+    """
+    total_us, children, start = 0, [], 0
+    for index, (name, depth, self_us, cumulative_us) in enumerate(imports):
+        if name == module and depth == 0:
+            total_us = cumulative_us
+            children = [entry for entry in imports[start:index] if entry[1] == 1]
+            break
+        if depth == 0:
+            start = index + 1
+    children.sort(key=lambda entry: entry[3], reverse=True)
+    return {
+        'total_ms': round(total_us / 1000, 1),
+        'top': [{'module': name, 'cumulative_ms': round(cumulative_us / 1000, 1)}
+                for name, _, _, cumulative_us in children[:top]],
+    }
+
+
+def profile_imports(module, settings_module, runs=5):
+    """
+    Import ``module`` in fresh interpreters under ``-X importtime`` and keep
+    the fastest run, which is the least disturbed by other work on the host.
+    """
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module)
+    best = None
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            capture_output=True, text=True, env=env, check=True,
+        )
+        profile = summarize_imports(parse_importtime(completed.stderr), module)
+        if best is None or profile['total_ms'] < best['total_ms']:
+            best = profile
+    return best
+
+
+def compare(results, baseline, tolerance=0.25, min_delta_ms=1.0):
+    """
+    Return a list of human-readable regressions of ``results`` against
+    ``baseline``.
+
+    Latency (p95) and peak memory regress when they grow by more than
+    ``tolerance`` (a fraction); latency must also grow by at least
+    ``min_delta_ms`` so sub-millisecond jitter is ignored. Query counts are
+    deterministic, so any increase is a regression. Import time is held to
+    the same tolerance.
+    """
+    regressions = []
+    expected_import = baseline.get('import_time')
+    actual_import = results.get('import_time')
+    if expected_import and actual_import:
+        expected_ms, actual_ms = expected_import['total_ms'], actual_import['total_ms']
+        if actual_ms > expected_ms * (1 + tolerance) and actual_ms - expected_ms >= min_delta_ms:
+            regressions.append(f'import time: {actual_ms:.0f} ms > baseline {expected_ms:.0f} ms')
+
+    for size, endpoints in baseline.get('results', {}).items():
+        for endpoint, expected in endpoints.items():
+            actual = results.get('results', {}).get(size, {}).get(endpoint)
+            if actual is None:
+                continue
+            name = f'{size}/{endpoint}'
+
+            allowed_ms = expected['p95_ms'] * (1 + tolerance)
+            if actual['p95_ms'] > allowed_ms and actual['p95_ms'] - expected['p95_ms'] >= min_delta_ms:
+                regressions.append(
+                    f"{name}: p95 {actual['p95_ms']:.1f} ms > baseline {expected['p95_ms']:.1f} ms"
+                )
+
+            if actual['queries_max'] > expected['queries_max']:
+                regressions.append(
+                    f"{name}: {actual['queries_max']} queries > baseline {expected['queries_max']}"
+                )
+
+            allowed_kb = expected['peak_memory_kb'] * (1 + tolerance)
+            if actual['peak_memory_kb'] > allowed_kb:
+                regressions.append(
+                    f"{name}: peak memory {actual['peak_memory_kb']:.0f} KB > baseline {expected['peak_memory_kb']:.0f} KB"
+                )
+    return regressions
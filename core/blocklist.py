@@ -0,0 +1,106 @@
+"""
+Disposable and abusive email domain blocklist for the contact form.
+
+Each file in ``EMAIL_DOMAIN_BLOCKLIST['FILES']`` has one entry per line:
+
+- ``example.com`` blocks example.com and every subdomain of it
+- ``*.example.com`` blocks the subdomains only, for services that hand
+  out a random subdomain per inbox
+
+Entries are held in frozensets, so checking an address costs one set lookup
+per label of its domain, however long the lists are. Running workers reload
+a file within ``RELOAD_INTERVAL`` seconds of it changing.
+"""
+import threading
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .reloadable import ReloadingFile, data_lines
+
+DEFAULTS = {
+    'FILES': [
+        settings.BASE_DIR / 'core' / 'data' / 'disposable_domains.txt',
+        settings.BASE_DIR / 'core' / 'data' / 'disposable_domains_upstream.txt',
+    ],
+    'RELOAD_INTERVAL': 30,
+}
+
+_lock = threading.Lock()
+_files = None
+
+
+def blocklist_settings():
+    return {**DEFAULTS, **getattr(settings, 'EMAIL_DOMAIN_BLOCKLIST', {})}
+
+
+def normalize_domain(domain):
+    return domain.strip().rstrip('.').lower()
+
+
+class DomainBlocklist:
+    def __init__(self, entries):
+        domains = set()
+        wildcards = set()
+        for entry in map(normalize_domain, entries):
+            if entry.startswith('*.'):
+                wildcards.add(entry[2:])
+            elif entry:
+                domains.add(entry)
+        self.domains = frozenset(domains)
+        self.wildcards = frozenset(wildcards)
+
+    @classmethod
+    def from_text(cls, text):
+        return cls(data_lines(text))
+
+    def __len__(self):
+        return len(self.domains) + len(self.wildcards)
+
+    def match(self, domain):
+        """The entry blocking ``domain``, or None"""
+        labels = normalize_domain(domain).split('.')
+        for i in range(len(labels)):
+            parent = '.'.join(labels[i:])
+            if parent in self.domains:
+                return parent
+            if i and parent in self.wildcards:
+                return f'*.{parent}'
+        return None
+
+
+def blocklists():
+    """The configured blocklists, each reloaded when its file changes"""
+    global _files
+    if _files is None:
+        with _lock:
+            if _files is None:
+                config = blocklist_settings()
+                _files = [
+                    ReloadingFile(path, DomainBlocklist.from_text, config['RELOAD_INTERVAL'])
+                    for path in config['FILES']
+                ]
+    return [reloading.value for reloading in _files]
+
+
+def blocked_entry(email):
+    """The blocklist entry matching ``email``'s domain, or None"""
+    domain = email.rpartition('@')[2]
+    for blocklist in blocklists():
+        entry = blocklist.match(domain)
+        if entry is not None:
+            return entry
+    return None
+
+
+def is_blocked(email):
+    return blocked_entry(email) is not None
+
+
+@receiver(setting_changed)
+def reset_blocklists(setting, **kwargs):
+    global _files
+    if setting == 'EMAIL_DOMAIN_BLOCKLIST':
+        with _lock:
+            _files = None
@@ -0,0 +1,335 @@
+"""
+Two-tier cache backend: a bounded in-process LRU in front of a shared cache.
+
+Configure it with ``LOCATION`` set to the alias of the shared (remote) cache::
+
+    CACHES = {
+        'default': {
+            'BACKEND': 'core.cache.TieredCache',
+            'LOCATION': 'redis',
+            'OPTIONS': {'LOCAL_MAX_ENTRIES': 1000, 'LOCAL_TIMEOUT': 5},
+        },
+        'redis': {...},
+    }
+
+Entries in the local tier never outlive ``LOCAL_TIMEOUT`` seconds, which
+bounds how stale a worker can be after another worker writes to the shared
+tier. Local keys are the fully versioned keys, so ``incr_version()`` and the
+``VERSION`` setting invalidate both tiers together.
+
+The module also provides ``get_or_regenerate()``, the stampede-safe helper
+``core.views`` uses to cache page data: only one caller regenerates an
+expired entry while everyone else is served the stale value.
+"""
+import math
+import pickle
+import random
+import time
+import uuid
+from collections import OrderedDict
+from threading import Lock
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+from core.instrumentation import record
+from core.metrics import observe_cache_lookup
+
+# Process-wide local tiers and hit counters, keyed by the remote alias so
+# every thread's backend instance shares the same LRU.
+_local_stores = {}
+_locks = {}
+_stats = {}
+
+
+class TieredCache(BaseCache):
+    """In-process LRU with TTL that falls through to a remote cache alias"""
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._remote_alias = location
+        self._local_max_entries = int(options.get('LOCAL_MAX_ENTRIES', 1000))
+        self._local_timeout = float(options.get('LOCAL_TIMEOUT', 5))
+        self._local = _local_stores.setdefault(location, OrderedDict())
+        self._lock = _locks.setdefault(location, Lock())
+        self._stats = _stats.setdefault(location, {'local_hits': 0, 'remote_hits': 0, 'misses': 0})
+
+    @property
+    def remote(self):
+        return caches[self._remote_alias]
+
+    def _version(self, version):
+        return self.version if version is None else version
+
+    def _timeout(self, timeout):
+        return self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+
+    # Local tier helpers -----------------------------------------------------
+
+    def _local_expiry(self, timeout):
+        """Absolute expiry for a local entry, capped by the remote timeout"""
+        timeout = self._timeout(timeout)
+        local_timeout = self._local_timeout
+        if timeout is not None:
+            local_timeout = min(local_timeout, timeout)
+        return time.monotonic() + local_timeout
+
+    def _local_get(self, key):
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expiry, pickled = entry
+            if expiry <= time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+        return entry
+
+    def _local_set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        if self._local_max_entries <= 0 or self._local_timeout <= 0:
+            return
+        expiry = self._local_expiry(timeout)
+        if expiry <= time.monotonic():
+            self._local_delete(key)
+            return
+        pickled = pickle.dumps(value, self.pickle_protocol)
+        with self._lock:
+            self._local[key] = (expiry, pickled)
+            self._local.move_to_end(key)
+            while len(self._local) > self._local_max_entries:
+                self._local.popitem(last=False)
+
+    def _local_delete(self, key):
+        with self._lock:
+            return self._local.pop(key, None) is not None
+
+    def _record(self, counter, amount=1):
+        with self._lock:
+            self._stats[counter] += amount
+
+    # Cache API --------------------------------------------------------------
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        version = self._version(version)
+        added = self.remote.add(key, value, timeout=self._timeout(timeout), version=version)
+        if added:
+            self._local_set(self.make_and_validate_key(key, version=version), value, timeout)
+        return added
+
+    def get(self, key, default=None, version=None):
+        version = self._version(version)
+        local_key = self.make_and_validate_key(key, version=version)
+        entry = self._local_get(local_key)
+        if entry is not None:
+            self._record('local_hits')
+            return pickle.loads(entry[1])
+
+        sentinel = object()
+        value = self.remote.get(key, sentinel, version=version)
+        if value is sentinel:
+            self._record('misses')
+            return default
+        self._record('remote_hits')
+        self._local_set(local_key, value)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        version = self._version(version)
+        self.remote.set(key, value, timeout=self._timeout(timeout), version=version)
+        self._local_set(self.make_and_validate_key(key, version=version), value, timeout)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        version = self._version(version)
+        self._local_delete(self.make_and_validate_key(key, version=version))
+        return self.remote.touch(key, timeout=self._timeout(timeout), version=version)
+
+    def delete(self, key, version=None):
+        version = self._version(version)
+        self._local_delete(self.make_and_validate_key(key, version=version))
+        return self.remote.delete(key, version=version)
+
+    def has_key(self, key, version=None):
+        version = self._version(version)
+        if self._local_get(self.make_and_validate_key(key, version=version)) is not None:
+            return True
+        return self.remote.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        version = self._version(version)
+        self._local_delete(self.make_and_validate_key(key, version=version))
+        return self.remote.incr(key, delta, version=version)
+
+    def get_many(self, keys, version=None):
+        version = self._version(version)
+        found = {}
+        missing = []
+        for key in keys:
+            entry = self._local_get(self.make_and_validate_key(key, version=version))
+            if entry is None:
+                missing.append(key)
+            else:
+                found[key] = pickle.loads(entry[1])
+        if found:
+            self._record('local_hits', len(found))
+        if missing:
+            remote_found = self.remote.get_many(missing, version=version)
+            self._record('remote_hits', len(remote_found))
+            self._record('misses', len(missing) - len(remote_found))
+            for key, value in remote_found.items():
+                self._local_set(self.make_and_validate_key(key, version=version), value)
+            found.update(remote_found)
+        return found
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        version = self._version(version)
+        failed = self.remote.set_many(data, timeout=self._timeout(timeout), version=version)
+        for key, value in data.items():
+            if key not in failed:
+                self._local_set(self.make_and_validate_key(key, version=version), value, timeout)
+        return failed
+
+    def delete_many(self, keys, version=None):
+        version = self._version(version)
+        for key in keys:
+            self._local_delete(self.make_and_validate_key(key, version=version))
+        self.remote.delete_many(keys, version=version)
+
+    def clear(self):
+        self.clear_local()
+        self.remote.clear()
+
+    def close(self, **kwargs):
+        self.remote.close(**kwargs)
+
+    # Introspection ----------------------------------------------------------
+
+    def clear_local(self):
+        """Drop this process's local tier without touching the remote tier"""
+        with self._lock:
+            self._local.clear()
+
+    def stats(self):
+        """Per-tier hit counts and ratios for this process"""
+        with self._lock:
+            counts = dict(self._stats)
+            local_size = len(self._local)
+        lookups = sum(counts.values())
+        counts['lookups'] = lookups
+        counts['local_entries'] = local_size
+        counts['local_hit_ratio'] = counts['local_hits'] / lookups if lookups else 0.0
+        counts['remote_hit_ratio'] = counts['remote_hits'] / lookups if lookups else 0.0
+        counts['hit_ratio'] = (counts['local_hits'] + counts['remote_hits']) / lookups if lookups else 0.0
+        return counts
+
+    def reset_stats(self):
+        with self._lock:
+            for counter in self._stats:
+                self._stats[counter] = 0
+
+
+# Stampede-safe regeneration ---------------------------------------------------
+
+CONTENT_GENERATION_KEY = 'core:content-generation'
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def content_generation(cache=None):
+    """Current generation token for portfolio content keys"""
+    cache = cache or caches['default']
+    generation = cache.get(CONTENT_GENERATION_KEY)
+    if generation is None:
+        cache.add(CONTENT_GENERATION_KEY, time.time_ns(), None)
+        generation = cache.get(CONTENT_GENERATION_KEY)
+    return generation
+
+
+def invalidate_content(cache=None):
+    """Move every portfolio content key to a new generation"""
+    cache = cache or caches['default']
+    cache.set(CONTENT_GENERATION_KEY, time.time_ns(), None)
+
+
+def _acquire_lock(cache, lock_key, timeout):
+    token = uuid.uuid4().hex
+    if cache.add(lock_key, token, timeout):
+        return token
+    return None
+
+
+def _release_lock(cache, lock_key, token):
+    if cache.get(lock_key) == token:
+        cache.delete(lock_key)
+
+
+def _should_refresh_early(fresh_until, cost, beta, now):
+    """Probabilistic early expiration (XFetch): refresh sooner for costly values"""
+    if beta <= 0 or cost <= 0:
+        return False
+    return now - cost * beta * math.log(1.0 - random.random()) >= fresh_until
+
+
+def _regenerate(cache, key, regenerate, timeout, stale):
+    started = time.monotonic()
+    value = regenerate()
+    cost = time.monotonic() - started
+    cache.set(key, (value, time.time() + timeout, cost), timeout + stale)
+    return value
+
+
+def get_or_regenerate(key, regenerate, timeout=None, stale=None, beta=None, cache_alias='default'):
+    """
+    Return the cached value for ``key``, calling ``regenerate()`` at most once
+    per expiry across all workers.
+
+    Values are kept for ``timeout + stale`` seconds. During the stale window a
+    single caller holding the regeneration lock rebuilds the value while the
+    others keep serving the old one. On a cold miss, callers that lose the lock
+    wait for the winner instead of hitting the database themselves.
+    """
+    cache = caches[cache_alias]
+    timeout = _setting('VIEW_CACHE_TIMEOUT', 300) if timeout is None else timeout
+    stale = _setting('VIEW_CACHE_STALE_WHILE_REVALIDATE', 60) if stale is None else stale
+    beta = _setting('VIEW_CACHE_EARLY_REFRESH_BETA', 1.0) if beta is None else beta
+    lock_timeout = _setting('VIEW_CACHE_LOCK_TIMEOUT', 10)
+
+    key = f'core:{content_generation(cache)}:{key}'
+    lock_key = f'{key}:lock'
+
+    envelope = cache.get(key)
+    record('cache_hits' if envelope is not None else 'cache_misses')
+    observe_cache_lookup(envelope is not None)
+    if envelope is not None:
+        value, fresh_until, cost = envelope
+        now = time.time()
+        if now < fresh_until and not _should_refresh_early(fresh_until, cost, beta, now):
+            return value
+        token = _acquire_lock(cache, lock_key, lock_timeout)
+        if token is None:
+            return value
+        try:
+            return _regenerate(cache, key, regenerate, timeout, stale)
+        finally:
+            _release_lock(cache, lock_key, token)
+
+    token = _acquire_lock(cache, lock_key, lock_timeout)
+    if token is not None:
+        try:
+            return _regenerate(cache, key, regenerate, timeout, stale)
+        finally:
+            _release_lock(cache, lock_key, token)
+
+    # Someone else is regenerating: wait for their value rather than piling on
+    deadline = time.monotonic() + lock_timeout
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        envelope = cache.get(key)
+        if envelope is not None:
+            return envelope[0]
+    return regenerate()
@@ -1,6 +1,7 @@
 from django import forms
 from django.core.validators import EmailValidator
 from django.core.exceptions import ValidationError
+from . import blocklist, spam
 from .models import Contact
 import re
 
@@ -66,13 +67,8 @@ class ContactForm(forms.ModelForm):
         except ValidationError:
             raise ValidationError('Please enter a valid email address.')
         
-        # Check for disposable email domains (basic check)
-        disposable_domains = [
-            '10minutemail.com', 'guerrillamail.com', 'tempmail.org',
-            'mailinator.com', 'throwaway.email', 'temp-mail.org'
-        ]
-        domain = email.split('@')[1].lower()
-        if domain in disposable_domains:
+        # Disposable and abusive domains, including their subdomains
+        if blocklist.is_blocked(email):
             raise ValidationError('Please use a valid email address.')
         
         return email.lower()
@@ -113,15 +109,7 @@ class ContactForm(forms.ModelForm):
         if len(message) > 2000:
             raise ValidationError('Message cannot exceed 2000 characters.')
         
-        # Basic spam detection
-        spam_indicators = [
-            'buy now', 'click here', 'free money', 'lottery winner',
-            'urgent reply', 'limited time', 'act now', 'make money fast'
-        ]
-        message_lower = message.lower()
-        spam_count = sum(1 for indicator in spam_indicators if indicator in message_lower)
-        
-        if spam_count >= 2:
+        if spam.score(message).is_spam:
             raise ValidationError('Your message appears to be spam. Please write a genuine message.')
         
         return message
@@ -143,10 +131,11 @@ class FileUploadForm(forms.Form):
         self.allowed_types = kwargs.pop('allowed_types', [])
         self.max_size = kwargs.pop('max_size', 5 * 1024 * 1024)  # 5MB default
         super().__init__(*args, **kwargs)
+        self.fields['file'].help_text = f'Maximum file size: {self.max_size // (1024*1024)}MB'
     
     file = forms.FileField(
         label='Select File',
-        help_text=f'Maximum file size: {self.max_size // (1024*1024)}MB'
+        help_text='Maximum file size: 5MB'
     )
     
     def clean_file(self):
@@ -0,0 +1,125 @@
+"""
+Liveness and readiness endpoints.
+
+``HealthCheckMiddleware`` sits first in ``MIDDLEWARE`` and answers
+``/healthz`` and ``/readyz`` itself, so probes skip the SSL redirect,
+sessions, CSRF, messages, URL resolution and request metrics.
+
+``/healthz`` only proves the process is serving requests. ``/readyz`` checks
+the database, the default cache and pending migrations, and caches its
+result for ``READINESS_CACHE_SECONDS`` so frequent probes stay cheap. The
+unauthenticated response only says which checks failed; the errors
+themselves, which may name hosts or users, go to the log.
+"""
+import json
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import HttpResponse
+
+logger = logging.getLogger(__name__)
+
+_readiness = {'checked_at': None, 'result': None}
+_readiness_lock = threading.Lock()
+# Migrations cannot become unapplied under a running process, so once they
+# are all applied the check is skipped for the rest of its lifetime
+_migrations_applied = False
+
+
+def check_database():
+    with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+        cursor.execute('SELECT 1')
+        cursor.fetchone()
+
+
+def check_cache():
+    cache = caches['default']
+    cache.set('core:readyz', 'ok', 30)
+    if cache.get('core:readyz') != 'ok':
+        raise RuntimeError('cache did not return the value just written')
+
+
+def pending_migrations(connection):
+    """Unapplied migrations, without taking migrate's locks or emitting signals"""
+    # The migration loader is only needed by the first readiness probe and at
+    # startup, so keep it out of every worker's import
+    from django.db.migrations.executor import MigrationExecutor
+
+    executor = MigrationExecutor(connection)
+    return executor.migration_plan(executor.loader.graph.leaf_nodes())
+
+
+def check_migrations():
+    global _migrations_applied
+    if _migrations_applied:
+        return
+    plan = pending_migrations(connections[DEFAULT_DB_ALIAS])
+    if plan:
+        raise RuntimeError(f'{len(plan)} unapplied migration(s)')
+    _migrations_applied = True
+
+
+READINESS_CHECKS = {
+    'database': check_database,
+    'cache': check_cache,
+    'migrations': check_migrations,
+}
+
+
+def run_readiness_checks():
+    checks = {}
+    for name, check in READINESS_CHECKS.items():
+        try:
+            check()
+            checks[name] = 'ok'
+        except Exception as exc:
+            logger.error(f"Readiness check {name} failed: {exc.__class__.__name__}: {exc}")
+            checks[name] = 'failed'
+    ready = all(status == 'ok' for status in checks.values())
+    return {'status': 'ok' if ready else 'unavailable', 'checks': checks}
+
+
+def readiness():
+    """Readiness result, recomputed at most every READINESS_CACHE_SECONDS"""
+    max_age = getattr(settings, 'READINESS_CACHE_SECONDS', 5)
+    with _readiness_lock:
+        checked_at = _readiness['checked_at']
+        if checked_at is None or time.monotonic() - checked_at >= max_age:
+            _readiness['result'] = run_readiness_checks()
+            _readiness['checked_at'] = time.monotonic()
+        return _readiness['result']
+
+
+def healthz(request):
+    return HttpResponse('ok', content_type='text/plain')
+
+
+def readyz(request):
+    result = readiness()
+    return HttpResponse(
+        json.dumps(result),
+        content_type='application/json',
+        status=200 if result['status'] == 'ok' else 503,
+    )
+
+
+class HealthCheckMiddleware:
+    """Answer health probes before any other middleware runs"""
+
+    endpoints = {
+        '/healthz': healthz,
+        '/readyz': readyz,
+    }
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        endpoint = self.endpoints.get(request.path_info.rstrip('/'))
+        if endpoint is not None and request.method in ('GET', 'HEAD'):
+            return endpoint(request)
+        return self.get_response(request)
@@ -0,0 +1,196 @@
+"""
+Per-request performance instrumentation.
+
+``PerformanceMiddleware`` collects SQL query count and time, template render
+time, page data cache hits/misses and notification time for every request and
+feeds the Prometheus metrics in ``core.metrics``. Staff users get the numbers
+as a ``Server-Timing`` header; a sample of requests (``PERFORMANCE_SAMPLE_RATE``,
+staff requests are always included) is logged to ``core.performance`` with
+the numbers as record fields.
+
+Other modules report into the current request with ``record()`` and
+``timed()``, which are no-ops outside a measured request.
+"""
+import logging
+import random
+import re
+import time
+import uuid
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from django.template.backends.django import DjangoTemplates, Template, reraise
+from django.template import TemplateDoesNotExist
+
+from core import slow_queries
+from core.log import reset_request_context, set_request_context
+from core.metrics import observe_request
+
+logger = logging.getLogger('core.performance')
+
+# Incoming X-Request-ID values (e.g. set by nginx) are reused when they look sane
+_REQUEST_ID = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+
+_current = ContextVar('core_request_metrics', default=None)
+
+
+class RequestMetrics:
+    """Counters and timings for a single request"""
+
+    def __init__(self, request=None):
+        self.request = request
+        self.started = time.perf_counter()
+        self.values = {
+            'db_queries': 0,
+            'db_ms': 0.0,
+            'template_ms': 0.0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'notification_ms': 0.0,
+        }
+
+    def add(self, name, amount=1):
+        self.values[name] = self.values.get(name, 0) + amount
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self, total_ms):
+        values = self.values
+        return ', '.join([
+            f'db;dur={values["db_ms"]:.1f};desc="{values["db_queries"]} queries"',
+            f'tpl;dur={values["template_ms"]:.1f};desc="templates"',
+            f'cache;desc="{values["cache_hits"]} hits, {values["cache_misses"]} misses"',
+            f'notify;dur={values["notification_ms"]:.1f};desc="notifications"',
+            f'total;dur={total_ms:.1f}',
+        ])
+
+
+def current_metrics():
+    """Metrics of the request being measured on this thread, if any"""
+    return _current.get()
+
+
+def record(name, amount=1):
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.add(name, amount)
+
+
+@contextmanager
+def timed(name):
+    """Add the time spent in the block, in milliseconds, to ``name``"""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.add(name, (time.perf_counter() - start_time) * 1000)
+
+
+def _query_timer(execute, sql, params, many, context):
+    # EXPLAIN for the slow query log is not part of the request's own work
+    if slow_queries.explaining():
+        return execute(sql, params, many, context)
+    start_time = time.perf_counter()
+    result = execute(sql, params, many, context)
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.add('db_queries')
+        metrics.add('db_ms', elapsed_ms)
+        slow_queries.capture(context['connection'], sql, params, many, elapsed_ms, metrics.request)
+    return result
+
+
+class InstrumentedTemplate(Template):
+    def render(self, context=None, request=None):
+        with timed('template_ms'):
+            return super().render(context, request)
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """DjangoTemplates backend whose templates report their render time"""
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return InstrumentedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
+
+
+class PerformanceMiddleware:
+    """Measure every request; report via metrics, Server-Timing and sampled logs"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def is_staff(self, request):
+        # Reading request.user touches the session, which adds "Vary: Cookie" to
+        # the response, so leave it alone for requests that cannot be logged in
+        if settings.SESSION_COOKIE_NAME not in request.COOKIES:
+            return False
+        user = getattr(request, 'user', None)
+        return bool(user is not None and user.is_staff)
+
+    def request_id(self, request):
+        request_id = request.headers.get('X-Request-ID', '')
+        return request_id if _REQUEST_ID.match(request_id) else uuid.uuid4().hex
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # Reverted together with the request id when __call__ resets the context
+        set_request_context(view=request.resolver_match.url_name)
+
+    def __call__(self, request):
+        request.request_id = self.request_id(request)
+        log_token = set_request_context(request_id=request.request_id)
+        metrics = RequestMetrics(request)
+        token = _current.set(metrics)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_query_timer))
+                response = self.get_response(request)
+            response['X-Request-ID'] = request.request_id
+            self.report(request, response, metrics)
+        finally:
+            _current.reset(token)
+            reset_request_context(log_token)
+        return response
+
+    def report(self, request, response, metrics):
+        total_ms = metrics.elapsed_ms()
+        observe_request(request, response, total_ms, metrics.values['db_queries'])
+
+        staff = self.is_staff(request)
+        if staff:
+            response['Server-Timing'] = metrics.server_timing(total_ms)
+        sample_rate = getattr(settings, 'PERFORMANCE_SAMPLE_RATE', 1.0)
+        if not staff and random.random() >= sample_rate:
+            return
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        fields = {
+            'method': request.method,
+            'path': request.path,
+            'view': resolver_match.url_name if resolver_match else None,
+            'status': response.status_code,
+            'duration_ms': round(total_ms, 2),
+            **{
+                name: round(value, 2) if isinstance(value, float) else value
+                for name, value in metrics.values.items()
+            },
+        }
+        logger.info(
+            '%s %s %s %.1fms (%d queries)',
+            request.method, request.path, response.status_code, total_ms, metrics.values['db_queries'],
+            extra=fields,
+        )
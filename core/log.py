@@ -0,0 +1,239 @@
+"""
+Logging helpers.
+
+``JsonFormatter`` writes one JSON object per line with the standard record
+fields, the current request's id and view, and anything passed through
+``extra=``, so structured fields such as the slow query log's SQL and plan
+survive intact for later analysis.
+
+``QueueFileHandler`` keeps file and console I/O out of request threads: the
+handler only puts records on a bounded queue and a listener thread writes
+them to a size-rotated file. Every gunicorn worker has its own listener, so
+``SharedRotatingFileHandler`` serializes writes and rotation through a lock
+file and reopens the log after another worker has rotated it. When the queue
+fills up records are dropped, routine INFO ones first, instead of blocking
+the request.
+"""
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+try:
+    import fcntl
+except ImportError:  # Windows development machines run a single process
+    fcntl = None
+
+# Attributes every LogRecord has; anything else came from ``extra=``
+_RESERVED = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+# Request id and view of the request being handled on this thread
+_request_context = ContextVar('core_log_request_context', default=None)
+
+
+def set_request_context(**fields):
+    """Attach ``fields`` to every record logged by the current request"""
+    context = dict(_request_context.get() or {})
+    context.update(fields)
+    return _request_context.set(context)
+
+
+def reset_request_context(token):
+    _request_context.reset(token)
+
+
+def request_context():
+    return _request_context.get() or {}
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        # Records from QueueFileHandler carry the context captured when they were logged
+        context = getattr(record, '_request_context', None)
+        entry.update(request_context() if context is None else context)
+        for key, value in vars(record).items():
+            if key not in _RESERVED and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class SharedRotatingFileHandler(RotatingFileHandler):
+    """
+    ``RotatingFileHandler`` for a file several processes write to.
+
+    Each write, and the rotation it may trigger, happens under an exclusive
+    ``flock`` on ``<filename>.lock``, so only one process rotates and the
+    size check sees every process's writes. A process whose file was rotated
+    by another one reopens the new file before writing. The stream and lock
+    are reopened after a fork, since a shared file description would share
+    the lock as well.
+    """
+
+    def __init__(self, filename, maxBytes=0, backupCount=0):
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, delay=True)
+        self._lock_file = None
+        self._pid = None
+
+    def _ensure_open(self):
+        if self._pid != os.getpid():
+            if self.stream is not None:
+                self.stream.close()
+            self.stream = self._open()
+            self._lock_file = open(f'{self.baseFilename}.lock', 'a')
+            self._pid = os.getpid()
+        elif self.stream is None:
+            self.stream = self._open()
+
+    def _rotated_elsewhere(self):
+        try:
+            return os.stat(self.baseFilename).st_ino != os.fstat(self.stream.fileno()).st_ino
+        except FileNotFoundError:
+            return True
+
+    def emit(self, record):
+        try:
+            self._ensure_open()
+            if fcntl is not None:
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            try:
+                if self._rotated_elsewhere():
+                    self.stream.close()
+                    self.stream = self._open()
+                if self.shouldRollover(record):
+                    self.doRollover()
+                    self.stream = self._open()
+                logging.FileHandler.emit(self, record)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        super().close()
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+            self._pid = None
+
+
+class QueueFileHandler(QueueHandler):
+    """
+    Queue records for a listener thread that writes them as JSON lines to a
+    size-rotated file shared by every worker (and optionally stderr).
+
+    Request threads never wait: once the queue is ``pressure`` full, records
+    at ``drop_level`` or below (routine INFO by default) are discarded, which
+    leaves the rest of the queue to warnings and errors; those are dropped
+    only when it is completely full. Drops are counted and reported in a
+    warning once the queue drains.
+    """
+
+    def __init__(self, filename, maxBytes=10 * 1024 * 1024, backupCount=5, queue_size=10000,
+                 drop_level='INFO', pressure=0.8, console=False):
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.queue_size = queue_size
+        self.drop_level = logging._checkLevel(drop_level)
+        self.pressure = pressure
+        self.dropped = 0
+        self._unreported = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+        formatter = JsonFormatter()
+        targets = [SharedRotatingFileHandler(filename, maxBytes=maxBytes, backupCount=backupCount)]
+        if console:
+            targets.append(logging.StreamHandler(sys.stderr))
+        for target in targets:
+            target.setFormatter(formatter)
+        self.targets = targets
+
+        self._listener = None
+        self._listener_pid = None
+        self._lock = threading.Lock()
+        atexit.register(self.stop)
+
+    def _ensure_listener(self):
+        # Forked workers (gunicorn --preload) do not inherit the parent's thread
+        if self._listener_pid == os.getpid():
+            return
+        with self._lock:
+            if self._listener_pid != os.getpid():
+                self._listener = QueueListener(self.queue, *self.targets, respect_handler_level=True)
+                self._listener.start()
+                self._listener_pid = os.getpid()
+
+    def stop(self):
+        """Flush queued records and stop the listener thread"""
+        if self._listener is not None and self._listener_pid == os.getpid():
+            self._listener.stop()
+            self._listener = None
+            self._listener_pid = None
+
+    def close(self):
+        self.stop()
+        for target in self.targets:
+            target.close()
+        super().close()
+
+    def prepare(self, record):
+        # Merge args and render the traceback now, since the original objects may
+        # change before the listener gets to them, and keep the exception separate
+        # from the message for the JSON output
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        # The listener thread cannot see this request's context, so capture it now
+        record._request_context = request_context()
+        return record
+
+    def _drop(self):
+        with self._lock:
+            self.dropped += 1
+            self._unreported += 1
+
+    def enqueue(self, record):
+        self._ensure_listener()
+        if record.levelno <= self.drop_level and self.queue.qsize() >= self.queue_size * self.pressure:
+            self._drop()
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._drop()
+            return
+
+        if self._unreported and self.queue.qsize() < self.queue_size * self.pressure:
+            with self._lock:
+                unreported, self._unreported = self._unreported, 0
+            if unreported:
+                warning = logging.makeLogRecord({
+                    'name': __name__,
+                    'levelno': logging.WARNING,
+                    'levelname': 'WARNING',
+                    'msg': 'Dropped %d log records while the logging queue was full',
+                    'args': (unreported,),
+                })
+                try:
+                    self.queue.put_nowait(self.prepare(warning))
+                except queue.Full:
+                    pass
@@ -0,0 +1,234 @@
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import connection
+from django.test import Client
+from django.test.utils import (
+    CaptureQueriesContext, override_settings, setup_test_environment, teardown_test_environment,
+)
+from django.urls import reverse
+from django.utils import timezone
+from core.benchmark import summarize, compare, load_results, profile_imports, write_results
+from core.models import Project
+from core.notifications import locmem
+from io import StringIO
+from pathlib import Path
+import platform
+import time
+import tracemalloc
+import django
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark every public view, API endpoint and the contact form against '
+        'generated datasets of several sizes and compare with the committed baseline'
+    )
+
+    # generate_load_data volumes for each dataset size
+    DATASETS = {
+        'small': {'skills': 50, 'projects': 100, 'contacts': 1000},
+        'medium': {'skills': 500, 'projects': 1000, 'contacts': 20000},
+        'large': {'skills': 2000, 'projects': 10000, 'contacts': 100000},
+    }
+
+    DEFAULT_OUTPUT = Path(settings.BASE_DIR) / 'benchmarks' / 'results.json'
+    DEFAULT_BASELINE = Path(settings.BASE_DIR) / 'benchmarks' / 'baseline.json'
+
+    # Imported by every gunicorn worker (and once more by the --preload master)
+    IMPORT_MODULE = 'portfolio_django.wsgi'
+    IMPORT_BUDGET_MS = 500
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--size',
+            action='append',
+            choices=list(self.DATASETS),
+            help='Dataset size to run (can be given more than once, default: all)',
+        )
+        parser.add_argument('--iterations', type=int, default=30, help='Requests per endpoint')
+        parser.add_argument('--output', default=str(self.DEFAULT_OUTPUT), help='Where to write the JSON results')
+        parser.add_argument('--baseline', default=str(self.DEFAULT_BASELINE), help='Baseline results to compare against')
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.25,
+            help='Allowed relative growth of p95 latency and peak memory before failing',
+        )
+        parser.add_argument(
+            '--min-delta-ms',
+            type=float,
+            default=1.0,
+            help='Ignore latency growth smaller than this many milliseconds',
+        )
+        parser.add_argument(
+            '--import-budget-ms',
+            type=float,
+            default=self.IMPORT_BUDGET_MS,
+            help=f'Fail when importing {self.IMPORT_MODULE} takes longer than this',
+        )
+        parser.add_argument('--import-runs', type=int, default=5, help='Interpreters to profile imports in')
+        parser.add_argument(
+            '--update-baseline',
+            action='store_true',
+            help='Write the results to the baseline file instead of comparing',
+        )
+
+    def get_endpoints(self):
+        """(name, method, url, data) for everything that is benchmarked"""
+        project = Project.objects.order_by('pk').first()
+        endpoints = [
+            ('index', 'get', reverse('index'), None),
+            ('about', 'get', reverse('about'), None),
+            ('projects', 'get', reverse('projects'), None),
+            ('projects_category', 'get', f"{reverse('projects')}?category=web", None),
+            ('projects_search', 'get', f"{reverse('projects')}?search=project+1", None),
+            ('contact', 'get', reverse('contact'), None),
+            ('dashboard', 'get', reverse('dashboard'), None),
+            ('api_skills', 'get', reverse('api_skills'), None),
+            ('api_projects', 'get', reverse('api_projects'), None),
+            ('contact_post', 'post', reverse('contact'), {
+                'name': 'Benchmark User',
+                'email': 'benchmark@example.com',
+                'subject': 'Load benchmark',
+                'message': 'Benchmark message sent by the benchmark command.',
+            }),
+        ]
+        if project is not None:
+            endpoints.append(('project_detail', 'get', reverse('project_detail', args=[project.pk]), None))
+        return endpoints
+
+    def request(self, client, method, url, data):
+        if method == 'post':
+            return client.post(url, data, secure=settings.SECURE_SSL_REDIRECT)
+        return client.get(url, secure=settings.SECURE_SSL_REDIRECT)
+
+    def measure(self, client, method, url, data, iterations):
+        """Metrics for one endpoint, or None when it does not respond successfully"""
+        latencies_ms, query_counts = [], []
+        for _ in range(iterations):
+            with CaptureQueriesContext(connection) as queries:
+                start_time = time.perf_counter()
+                response = self.request(client, method, url, data)
+                latencies_ms.append((time.perf_counter() - start_time) * 1000)
+            query_counts.append(len(queries))
+            if response.status_code >= 400:
+                self.stdout.write(self.style.WARNING(
+                    f'{method.upper()} {url} returned {response.status_code}; skipping'
+                ))
+                return None
+
+        # Memory is sampled separately since tracemalloc slows every allocation
+        tracemalloc.start()
+        try:
+            self.request(client, method, url, data)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return summarize(latencies_ms, query_counts, peak_memory)
+
+    def run_size(self, size, iterations):
+        """Generate the dataset for ``size`` and benchmark every endpoint against it"""
+        volumes = self.DATASETS[size]
+        call_command(
+            'generate_load_data', '--clear',
+            '--skills', str(volumes['skills']),
+            '--projects', str(volumes['projects']),
+            '--contacts', str(volumes['contacts']),
+            stdout=StringIO(),
+        )
+        caches['default'].clear()
+        locmem.outbox.clear()
+
+        user, _ = User.objects.get_or_create(username='benchmark', defaults={'is_staff': True})
+        client = Client(raise_request_exception=False)
+        client.force_login(user)
+
+        results = {}
+        for name, method, url, data in self.get_endpoints():
+            metrics = self.measure(client, method, url, data, iterations)
+            if metrics is None:
+                continue
+            results[name] = metrics
+            self.stdout.write(
+                f"{size:<7} {name:<18} p50 {metrics['p50_ms']:8.1f} ms  p95 {metrics['p95_ms']:8.1f} ms  "
+                f"max {metrics['max_ms']:8.1f} ms  queries {metrics['queries_max']:4d}  "
+                f"memory {metrics['peak_memory_kb']:8.0f} KB"
+            )
+        return results
+
+    def run(self, sizes, iterations):
+        """Run every size against a throwaway test database"""
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        # Keep the run away from the real caches (sessions, rate limits, cacheops
+        # in Redis) and notification providers: contact_post would otherwise send
+        # real emails and SMS. It also repeats one submission, so measure the full
+        # path rather than the duplicate check.
+        isolated = override_settings(
+            CACHES={
+                alias: {
+                    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                    'LOCATION': f'benchmark-{alias}',
+                }
+                for alias in settings.CACHES
+            },
+            CACHEOPS_ENABLED=False,
+            NOTIFICATION_CHANNELS={'memory': {'BACKEND': 'core.notifications.locmem.InMemoryChannel'}},
+            CONTACT_DUPLICATE_WINDOW=0,
+        )
+        try:
+            with isolated:
+                return {size: self.run_size(size, iterations) for size in sizes}
+        finally:
+            locmem.outbox.clear()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+    def profile_imports(self, runs):
+        profile = profile_imports(self.IMPORT_MODULE, settings.SETTINGS_MODULE, runs)
+        self.stdout.write(f"Importing {self.IMPORT_MODULE} took {profile['total_ms']:.0f} ms")
+        for entry in profile['top']:
+            self.stdout.write(f"  {entry['cumulative_ms']:8.1f} ms  {entry['module']}")
+        return profile
+
+    def handle(self, *args, **options):
+        sizes = options['size'] or list(self.DATASETS)
+        results = {
+            'created_at': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'iterations': options['iterations'],
+            'import_time': self.profile_imports(options['import_runs']),
+            'results': self.run(sizes, options['iterations']),
+        }
+
+        output = Path(options['output'])
+        output.parent.mkdir(parents=True, exist_ok=True)
+        write_results(output, results)
+        self.stdout.write(f'Results written to {output}')
+
+        import_ms = results['import_time']['total_ms']
+        if import_ms > options['import_budget_ms']:
+            raise CommandError(
+                f"Importing {self.IMPORT_MODULE} took {import_ms:.0f} ms, over the "
+                f"{options['import_budget_ms']:.0f} ms budget"
+            )
+
+        baseline = Path(options['baseline'])
+        if options['update_baseline']:
+            write_results(baseline, results)
+            self.stdout.write(self.style.SUCCESS(f'Baseline updated at {baseline}'))
+            return
+        if not baseline.exists():
+            self.stdout.write(self.style.WARNING(f'No baseline at {baseline}; skipping comparison'))
+            return
+
+        regressions = compare(results, load_results(baseline), options['tolerance'], options['min_delta_ms'])
+        if regressions:
+            for regression in regressions:
+                self.stdout.write(self.style.ERROR(regression))
+            raise CommandError(f'{len(regressions)} performance regression(s) against {baseline}')
+        self.stdout.write(self.style.SUCCESS('No regressions against baseline'))
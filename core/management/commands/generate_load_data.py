@@ -0,0 +1,174 @@
+from cacheops import invalidate_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from core.cache import invalidate_content
+from core.models import Skill, Project, Contact
+from datetime import date, timedelta
+import random
+import time
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate a deterministic, production-sized dataset (skills, projects with '
+        'technologies, contact submissions) for load and scaling tests'
+    )
+
+    # Marks generated rows so they can be told apart from real ones and removed;
+    # contacts also get addresses on a reserved domain no visitor can have
+    PREFIX = '[loadgen]'
+    EMAIL_DOMAIN = 'loadgen.example.invalid'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--skills', type=int, default=2000, help='Number of skills to create')
+        parser.add_argument('--projects', type=int, default=10000, help='Number of projects to create')
+        parser.add_argument('--contacts', type=int, default=100000, help='Number of contact submissions to create')
+        parser.add_argument('--days', type=int, default=365, help='Spread contact submissions over this many days')
+        parser.add_argument('--max-technologies', type=int, default=6, help='Maximum technologies per project')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows per bulk insert')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for reproducible data')
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='Delete previously generated rows before generating',
+        )
+
+    def chunks(self, rows, size):
+        """Group a row generator into lists of at most ``size`` items"""
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def bulk_insert(self, model, rows, chunk_size):
+        created = 0
+        for chunk in self.chunks(rows, chunk_size):
+            model.objects.bulk_create(chunk, batch_size=chunk_size)
+            created += len(chunk)
+        return created
+
+    def generated_skills(self):
+        return Skill.objects.filter(name__startswith=f'{self.PREFIX} ')
+
+    def generated_projects(self):
+        return Project.objects.filter(title__startswith=f'{self.PREFIX} ')
+
+    def generated_contacts(self):
+        return Contact.objects.filter(
+            subject__startswith=f'{self.PREFIX} ', email__endswith=f'@{self.EMAIL_DOMAIN}',
+        )
+
+    def generated_data_exists(self):
+        return self.generated_skills().exists() or self.generated_projects().exists()
+
+    def clear(self):
+        self.generated_contacts().delete()
+        self.generated_projects().delete()
+        self.generated_skills().delete()
+
+    def skill_rows(self, rng, count):
+        categories = [choice for choice, _ in Skill.CATEGORY_CHOICES]
+        for i in range(count):
+            yield Skill(
+                name=f'{self.PREFIX} skill {i}',
+                category=categories[i % len(categories)],
+                proficiency=rng.randint(40, 100),
+                featured=rng.random() < 0.05,
+                order=i,
+            )
+
+    def project_rows(self, rng, count):
+        categories = [choice for choice, _ in Project.CATEGORY_CHOICES]
+        today = date.today()
+        for i in range(count):
+            yield Project(
+                title=f'{self.PREFIX} project {i}',
+                description=f'Generated project {i} for load testing. ' * rng.randint(1, 8),
+                category=categories[i % len(categories)],
+                github_url=f'https://github.com/example/load-project-{i}',
+                featured=rng.random() < 0.02,
+                completed_date=today - timedelta(days=rng.randint(0, 5 * 365)),
+                order=i,
+            )
+
+    def technology_rows(self, rng, project_ids, skill_ids, max_technologies):
+        through = Project.technologies.through
+        for project_id in project_ids:
+            count = min(rng.randint(0, max_technologies), len(skill_ids))
+            for skill_id in rng.sample(skill_ids, count):
+                yield through(project_id=project_id, skill_id=skill_id)
+
+    def contact_rows(self, rng, count, days):
+        now = timezone.now()
+        span = days * 24 * 60 * 60
+        for i in range(count):
+            email = f'visitor{i % (count // 3 + 1)}@{self.EMAIL_DOMAIN}'
+            subject = f'{self.PREFIX} message {i}'
+            message = 'Generated contact message for load testing. ' * rng.randint(1, 10)
+            yield Contact(
+                name=f'Visitor {i}',
+                email=email,
+                subject=subject,
+                message=message,
+                # bulk_create skips Contact.save(), which normally fills this in
+                fingerprint=Contact.content_fingerprint(email, subject, message),
+                created_at=now - timedelta(seconds=rng.randint(0, span)),
+                is_read=rng.random() < 0.7,
+            )
+
+    def insert_contacts(self, rng, count, days, chunk_size):
+        """Insert contacts, then backdate them, since auto_now_add stamps them all with now()"""
+        created = 0
+        for chunk in self.chunks(self.contact_rows(rng, count, days), chunk_size):
+            created_at = [contact.created_at for contact in chunk]
+            Contact.objects.bulk_create(chunk, batch_size=chunk_size)
+            for contact, value in zip(chunk, created_at):
+                contact.created_at = value
+            Contact.objects.bulk_update(chunk, ['created_at'], batch_size=chunk_size)
+            created += len(chunk)
+        return created
+
+    def step(self, label, func, *args):
+        start_time = time.perf_counter()
+        count = func(*args)
+        elapsed = time.perf_counter() - start_time
+        self.stdout.write(f'{label}: {count} rows in {elapsed:.1f}s')
+        return count
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        chunk_size = options['chunk_size']
+
+        if options['clear']:
+            self.stdout.write('Clearing previously generated data...')
+            self.clear()
+        elif self.generated_data_exists():
+            # Skill names and project titles are unique, so a second run would fail mid-insert
+            raise CommandError('Generated data already exists; run again with --clear to replace it')
+
+        start_time = time.perf_counter()
+        with transaction.atomic():
+            self.step('Skills', self.bulk_insert, Skill, self.skill_rows(rng, options['skills']), chunk_size)
+            self.step('Projects', self.bulk_insert, Project, self.project_rows(rng, options['projects']), chunk_size)
+
+            skill_ids = list(self.generated_skills().values_list('pk', flat=True))
+            project_ids = self.generated_projects().values_list('pk', flat=True).iterator(chunk_size=chunk_size)
+            self.step(
+                'Project technologies', self.bulk_insert, Project.technologies.through,
+                self.technology_rows(rng, project_ids, skill_ids, options['max_technologies']), chunk_size
+            )
+            self.step(
+                'Contacts', self.insert_contacts, rng, options['contacts'], options['days'], chunk_size
+            )
+            # Bulk inserts bypass model signals, so invalidate caches by hand
+            for model in (Skill, Project, Project.technologies.through, Contact):
+                invalidate_model(model)
+            transaction.on_commit(invalidate_content)
+
+        elapsed = time.perf_counter() - start_time
+        self.stdout.write(self.style.SUCCESS(f'Generated load data in {elapsed:.1f}s'))
@@ -1,13 +1,13 @@
-from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
 from core.models import Profile, Skill, Project, Experience, Education, Certification
+from core.management.seeding import SeedCommand
 from datetime import date, timedelta
 
 
-class Command(BaseCommand):
+class Command(SeedCommand):
     help = 'Populate the database with fresher portfolio data for a final year student'
 
-    def handle(self, *args, **options):
+    def seed(self, loader, **options):
         self.stdout.write('Creating fresher portfolio data...')
 
         # Create a user if it doesn't exist
@@ -25,9 +25,9 @@ class Command(BaseCommand):
             self.stdout.write('Created user: siddharth')
 
         # Create profile for a final year student
-        profile, created = Profile.objects.get_or_create(
-            user=user,
-            defaults={
+        loader.upsert(Profile, [
+            {
+                'user': user,
                 'title': 'Python Developer — Full-Stack & AI',
                 'bio': 'Passionate Python Developer with expertise in Full-Stack Development and Artificial Intelligence. Currently pursuing B.Tech in Computer Science and Engineering (AI) with a strong foundation in modern web technologies and machine learning. Eager to apply my skills in real-world projects and contribute to innovative solutions.',
                 'location': 'Greater Noida, Uttar Pradesh',
@@ -37,9 +37,8 @@ class Command(BaseCommand):
                 'twitter_url': 'https://twitter.com/siddharth_mishra',
                 'available_for_work': True,
             }
-        )
-        if created:
-            self.stdout.write('Created profile')
+        ], ['user'])
+        self.stdout.write('Saved profile')
 
         # Create skills matching resume
         skills_data = [
@@ -82,13 +81,8 @@ class Command(BaseCommand):
             {'name': 'Netlify', 'category': 'tools', 'proficiency': 75, 'icon': 'fas fa-cloud', 'featured': False, 'order': 30},
         ]
 
-        for skill_data in skills_data:
-            skill, created = Skill.objects.get_or_create(
-                name=skill_data['name'],
-                defaults=skill_data
-            )
-            if created:
-                self.stdout.write(f'Created skill: {skill.name}')
+        skills = loader.upsert(Skill, skills_data, ['name'])
+        self.stdout.write(f'Saved {len(skills)} skills')
 
         # Create projects matching resume
         projects_data = [
@@ -124,31 +118,19 @@ class Command(BaseCommand):
             },
         ]
 
-        for project_data in projects_data:
-            project, created = Project.objects.get_or_create(
-                title=project_data['title'],
-                defaults=project_data
-            )
-            if created:
-                # Add relevant skills to each project
-                if project.title == 'Threat Intelligence Platform (Phishing Detection)':
-                    project.technologies.add(Skill.objects.get(name='Django'))
-                    project.technologies.add(Skill.objects.get(name='Scikit-learn'))
-                    project.technologies.add(Skill.objects.get(name='Python'))
-                    project.technologies.add(Skill.objects.get(name='PostgreSQL'))
-                elif project.title == 'IsharaX (Gesture Control System)':
-                    project.technologies.add(Skill.objects.get(name='OpenCV'))
-                    project.technologies.add(Skill.objects.get(name='Python'))
-                    try:
-                        project.technologies.add(Skill.objects.get(name='MediaPipe'))
-                    except Skill.DoesNotExist:
-                        pass
-                elif project.title == 'RasoiRack (Recipe Management System)':
-                    project.technologies.add(Skill.objects.get(name='Django'))
-                    project.technologies.add(Skill.objects.get(name='Python'))
-                    project.technologies.add(Skill.objects.get(name='SQLite'))
-                
-                self.stdout.write(f'Created project: {project.title}')
+        projects = loader.upsert(Project, projects_data, ['title'])
+
+        # Add relevant skills to each project
+        project_technologies = {
+            'Threat Intelligence Platform (Phishing Detection)': ['Django', 'Scikit-learn', 'Python', 'PostgreSQL'],
+            'IsharaX (Gesture Control System)': ['OpenCV', 'Python', 'MediaPipe'],
+            'RasoiRack (Recipe Management System)': ['Django', 'Python', 'SQLite'],
+        }
+        loader.link(Project.technologies, {
+            projects[title]: [skills[name] for name in names if name in skills]
+            for title, names in project_technologies.items()
+        })
+        self.stdout.write(f'Saved {len(projects)} projects')
 
         # Create experience
         experience_data = [
@@ -163,21 +145,14 @@ class Command(BaseCommand):
             },
         ]
 
-        for exp_data in experience_data:
-            experience, created = Experience.objects.get_or_create(
-                company=exp_data['company'],
-                position=exp_data['position'],
-                start_date=exp_data['start_date'],
-                defaults=exp_data
-            )
-            if created:
-                # Add relevant skills to experience
-                experience.technologies.add(Skill.objects.get(name='React'))
-                experience.technologies.add(Skill.objects.get(name='Django'))
-                experience.technologies.add(Skill.objects.get(name='CSS3'))
-                experience.technologies.add(Skill.objects.get(name='Git'))
-                experience.technologies.add(Skill.objects.get(name='GitHub'))
-                self.stdout.write(f'Created experience: {experience.position} at {experience.company}')
+        experiences = loader.upsert(Experience, experience_data, ['company', 'position', 'start_date'])
+
+        # Add relevant skills to experience
+        loader.link(Experience.technologies, {
+            pk: [skills[name] for name in ['React', 'Django', 'CSS3', 'Git', 'GitHub']]
+            for pk in experiences.values()
+        })
+        self.stdout.write(f'Saved {len(experiences)} experience entries')
 
         # Create education matching resume
         education_data = [
@@ -210,15 +185,8 @@ class Command(BaseCommand):
             },
         ]
 
-        for edu_data in education_data:
-            education, created = Education.objects.get_or_create(
-                institution=edu_data['institution'],
-                degree=edu_data['degree'],
-                field_of_study=edu_data['field_of_study'],
-                defaults=edu_data
-            )
-            if created:
-                self.stdout.write(f'Created education: {education.degree} in {education.field_of_study}')
+        education = loader.upsert(Education, education_data, ['institution', 'degree', 'field_of_study'])
+        self.stdout.write(f'Saved {len(education)} education entries')
 
         # Create certifications matching resume
         certifications_data = [
@@ -266,18 +234,11 @@ class Command(BaseCommand):
             },
         ]
 
-        for cert_data in certifications_data:
-            certification, created = Certification.objects.get_or_create(
-                name=cert_data['name'],
-                issuing_organization=cert_data['issuing_organization'],
-                defaults=cert_data
-            )
-            if created:
-                self.stdout.write(f'Created certification: {certification.name}')
+        certifications = loader.upsert(Certification, certifications_data, ['name', 'issuing_organization'])
+        self.stdout.write(f'Saved {len(certifications)} certifications')
 
         self.stdout.write(
             self.style.SUCCESS('Successfully created fresher portfolio data!')
         )
         self.stdout.write('You can now visit http://127.0.0.1:8000 to see your portfolio.')
         self.stdout.write('Admin credentials: username=siddharth, password=password123')
-
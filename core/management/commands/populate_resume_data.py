@@ -1,13 +1,13 @@
-from django.core.management.base import BaseCommand
 from django.utils import timezone
 from datetime import date, timedelta
 from django.contrib.auth.models import User
 from core.models import Profile, Skill, Project, Experience, Education, Certification, Contact
+from core.management.seeding import SeedCommand
 
-class Command(BaseCommand):
+class Command(SeedCommand):
     help = 'Populate database with Siddharth Mishra\'s actual resume data'
 
-    def handle(self, *args, **options):
+    def seed(self, loader, **options):
         self.stdout.write('Creating Siddharth Mishra\'s portfolio data...')
         
         # Clear existing data (except User and Contact)
@@ -29,9 +29,9 @@ class Command(BaseCommand):
             }
         )
 
-        profile, created = Profile.objects.get_or_create(
-            user=user,
-            defaults={
+        loader.upsert(Profile, [
+            {
+                'user': user,
                 'title': 'Python Developer — Full-Stack & AI',
                 'bio': 'Passionate Python Developer with expertise in Full-Stack Development and Artificial Intelligence. Fresh graduate with B.Tech in Computer Science and Engineering (AI) and a strong foundation in modern web technologies and machine learning. Seeking opportunities to apply my skills and grow professionally.',
                 'location': 'Greater Noida, Uttar Pradesh',
@@ -40,7 +40,7 @@ class Command(BaseCommand):
                 'github_url': 'https://github.com/siddharth-mishra',
                 'available_for_work': True,
             }
-        )
+        ], ['user'])
 
         # Create Skills
         skills_data = [
@@ -79,16 +79,7 @@ class Command(BaseCommand):
             {'name': 'Jira', 'category': 'tools', 'proficiency': 70, 'icon': 'fab fa-jira'},
         ]
 
-        for skill_data in skills_data:
-            skill, created = Skill.objects.get_or_create(
-                name=skill_data['name'],
-                defaults={
-                    'category': skill_data['category'],
-                    'proficiency': skill_data['proficiency'],
-                    'icon': skill_data['icon'],
-                    'featured': True,
-                }
-            )
+        loader.upsert(Skill, [{**skill_data, 'featured': True} for skill_data in skills_data], ['name'])
 
         # No experience - Fresh graduate
 
@@ -123,11 +114,7 @@ class Command(BaseCommand):
             }
         ]
 
-        for proj_data in projects_data:
-            project, created = Project.objects.get_or_create(
-                title=proj_data['title'],
-                defaults=proj_data
-            )
+        loader.upsert(Project, projects_data, ['title'])
 
         # Create Education
         education_data = [
@@ -160,12 +147,7 @@ class Command(BaseCommand):
             }
         ]
 
-        for edu_data in education_data:
-            education, created = Education.objects.get_or_create(
-                degree=edu_data['degree'],
-                institution=edu_data['institution'],
-                defaults=edu_data
-            )
+        loader.upsert(Education, education_data, ['degree', 'institution'])
 
         # Create Certifications
         certifications_data = [
@@ -213,12 +195,7 @@ class Command(BaseCommand):
             }
         ]
 
-        for cert_data in certifications_data:
-            certification, created = Certification.objects.get_or_create(
-                name=cert_data['name'],
-                issuing_organization=cert_data['issuing_organization'],
-                defaults=cert_data
-            )
+        loader.upsert(Certification, certifications_data, ['name', 'issuing_organization'])
 
         self.stdout.write(
             self.style.SUCCESS('Successfully created Siddharth Mishra\'s portfolio data!')
@@ -1,13 +1,13 @@
-from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
 from core.models import Profile, Skill, Project, Experience, Education, Certification
+from core.management.seeding import SeedCommand
 from datetime import date, timedelta
 
 
-class Command(BaseCommand):
+class Command(SeedCommand):
     help = 'Populate the database with sample portfolio data'
 
-    def handle(self, *args, **options):
+    def seed(self, loader, **options):
         self.stdout.write('Creating sample portfolio data...')
 
         # Create a user if it doesn't exist
@@ -25,9 +25,9 @@ class Command(BaseCommand):
             self.stdout.write('Created user: siddharth')
 
         # Create profile
-        profile, created = Profile.objects.get_or_create(
-            user=user,
-            defaults={
+        loader.upsert(Profile, [
+            {
+                'user': user,
                 'title': 'Full Stack Developer',
                 'bio': 'Passionate Full Stack Developer with expertise in modern web technologies. I love creating innovative solutions that make a difference in people\'s lives. With a strong foundation in both frontend and backend development, I bring ideas to life through clean, efficient, and scalable code.',
                 'location': 'New York, NY',
@@ -37,9 +37,8 @@ class Command(BaseCommand):
                 'twitter_url': 'https://twitter.com/siddharth',
                 'available_for_work': True,
             }
-        )
-        if created:
-            self.stdout.write('Created profile')
+        ], ['user'])
+        self.stdout.write('Saved profile')
 
         # Create skills
         skills_data = [
@@ -68,13 +67,8 @@ class Command(BaseCommand):
             {'name': 'AWS', 'category': 'tools', 'proficiency': 65, 'icon': 'fab fa-aws', 'featured': False, 'order': 16},
         ]
 
-        for skill_data in skills_data:
-            skill, created = Skill.objects.get_or_create(
-                name=skill_data['name'],
-                defaults=skill_data
-            )
-            if created:
-                self.stdout.write(f'Created skill: {skill.name}')
+        skills = loader.upsert(Skill, skills_data, ['name'])
+        self.stdout.write(f'Saved {len(skills)} skills')
 
         # Create projects
         projects_data = [
@@ -130,34 +124,21 @@ class Command(BaseCommand):
             },
         ]
 
-        for project_data in projects_data:
-            project, created = Project.objects.get_or_create(
-                title=project_data['title'],
-                defaults=project_data
-            )
-            if created:
-                # Add some skills to the project
-                if project.title == 'E-Commerce Platform':
-                    project.technologies.add(Skill.objects.get(name='React'))
-                    project.technologies.add(Skill.objects.get(name='Django'))
-                    project.technologies.add(Skill.objects.get(name='PostgreSQL'))
-                elif project.title == 'Task Management App':
-                    project.technologies.add(Skill.objects.get(name='React'))
-                    project.technologies.add(Skill.objects.get(name='Node.js'))
-                    project.technologies.add(Skill.objects.get(name='MongoDB'))
-                elif project.title == 'Analytics Dashboard':
-                    project.technologies.add(Skill.objects.get(name='React'))
-                    project.technologies.add(Skill.objects.get(name='Node.js'))
-                    project.technologies.add(Skill.objects.get(name='JavaScript'))
-                elif project.title == 'AI Chat Assistant':
-                    project.technologies.add(Skill.objects.get(name='Python'))
-                    project.technologies.add(Skill.objects.get(name='React'))
-                elif project.title == 'REST API Service':
-                    project.technologies.add(Skill.objects.get(name='Django'))
-                    project.technologies.add(Skill.objects.get(name='Python'))
-                    project.technologies.add(Skill.objects.get(name='PostgreSQL'))
-                
-                self.stdout.write(f'Created project: {project.title}')
+        projects = loader.upsert(Project, projects_data, ['title'])
+
+        # Add some skills to each project
+        project_technologies = {
+            'E-Commerce Platform': ['React', 'Django', 'PostgreSQL'],
+            'Task Management App': ['React', 'Node.js', 'MongoDB'],
+            'Analytics Dashboard': ['React', 'Node.js', 'JavaScript'],
+            'AI Chat Assistant': ['Python', 'React'],
+            'REST API Service': ['Django', 'Python', 'PostgreSQL'],
+        }
+        loader.link(Project.technologies, {
+            projects[title]: [skills[name] for name in names]
+            for title, names in project_technologies.items()
+        })
+        self.stdout.write(f'Saved {len(projects)} projects')
 
         # Create experience
         experiences_data = [
@@ -190,14 +171,8 @@ class Command(BaseCommand):
             },
         ]
 
-        for exp_data in experiences_data:
-            experience, created = Experience.objects.get_or_create(
-                company=exp_data['company'],
-                position=exp_data['position'],
-                defaults=exp_data
-            )
-            if created:
-                self.stdout.write(f'Created experience: {experience.position} at {experience.company}')
+        experiences = loader.upsert(Experience, experiences_data, ['company', 'position'])
+        self.stdout.write(f'Saved {len(experiences)} experience entries')
 
         # Create education
         education_data = [
@@ -217,15 +192,8 @@ class Command(BaseCommand):
             },
         ]
 
-        for edu_data in education_data:
-            education, created = Education.objects.get_or_create(
-                institution=edu_data['institution'],
-                degree=edu_data['degree'],
-                field_of_study=edu_data['field_of_study'],
-                defaults=edu_data
-            )
-            if created:
-                self.stdout.write(f'Created education: {education.degree} in {education.field_of_study}')
+        education = loader.upsert(Education, education_data, ['institution', 'degree', 'field_of_study'])
+        self.stdout.write(f'Saved {len(education)} education entries')
 
         # Create certifications
         certifications_data = [
@@ -252,14 +220,8 @@ class Command(BaseCommand):
             },
         ]
 
-        for cert_data in certifications_data:
-            certification, created = Certification.objects.get_or_create(
-                name=cert_data['name'],
-                issuing_organization=cert_data['issuing_organization'],
-                defaults=cert_data
-            )
-            if created:
-                self.stdout.write(f'Created certification: {certification.name}')
+        certifications = loader.upsert(Certification, certifications_data, ['name', 'issuing_organization'])
+        self.stdout.write(f'Saved {len(certifications)} certifications')
 
         self.stdout.write(
             self.style.SUCCESS('Successfully created sample portfolio data!')
@@ -1,13 +1,13 @@
-from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
 from core.models import Profile, Skill, Project, Experience, Education, Certification
+from core.management.seeding import SeedCommand
 from datetime import date
 
 
-class Command(BaseCommand):
+class Command(SeedCommand):
     help = 'Seed the database with initial data'
 
-    def handle(self, *args, **kwargs):
+    def seed(self, loader, **kwargs):
         # Create superuser
         user, created = User.objects.get_or_create(
             username='siddharth',
@@ -25,9 +25,9 @@ class Command(BaseCommand):
             self.stdout.write(self.style.SUCCESS('Created superuser'))
 
         # Create Profile
-        profile, created = Profile.objects.get_or_create(
-            user=user,
-            defaults={
+        loader.upsert(Profile, [
+            {
+                'user': user,
                 'title': 'Python Developer & AI Engineer',
                 'bio': 'I am a passionate Python developer and AI engineer with expertise in building scalable web applications and intelligent systems. I love solving complex problems and creating innovative solutions.',
                 'location': 'Greater Noida, India',
@@ -36,9 +36,8 @@ class Command(BaseCommand):
                 'linkedin_url': 'https://www.linkedin.com/in/siddharth-mishra-dev/',
                 'available_for_work': True,
             }
-        )
-        if created:
-            self.stdout.write(self.style.SUCCESS('Created profile'))
+        ], ['user'])
+        self.stdout.write(self.style.SUCCESS('Saved profile'))
 
         # Create Skills
         skills_data = [
@@ -68,12 +67,8 @@ class Command(BaseCommand):
 
         for i, skill_data in enumerate(skills_data):
             skill_data['order'] = i
-            skill, created = Skill.objects.get_or_create(
-                name=skill_data['name'],
-                defaults=skill_data
-            )
-            if created:
-                self.stdout.write(self.style.SUCCESS(f'Created skill: {skill.name}'))
+        skills = loader.upsert(Skill, skills_data, ['name'])
+        self.stdout.write(self.style.SUCCESS(f'Saved {len(skills)} skills'))
 
         # Create Projects
         projects_data = [
@@ -105,37 +100,19 @@ class Command(BaseCommand):
 
         for i, project_data in enumerate(projects_data):
             project_data['order'] = i
-            # Pop technologies to handle many-to-many separately
-            techs = project_data.pop('technologies', [])
-            
-            project, created = Project.objects.get_or_create(
-                title=project_data['title'],
-                defaults=project_data
-            )
-            
-            if created:
-                # Add some technologies
-                if i == 0:  # Student Management System
-                    project.technologies.add(
-                        Skill.objects.get(name='Python'),
-                        Skill.objects.get(name='Django'),
-                        Skill.objects.get(name='React'),
-                        Skill.objects.get(name='PostgreSQL'),
-                    )
-                elif i == 1:  # AI Tutor
-                    project.technologies.add(
-                        Skill.objects.get(name='Python'),
-                        Skill.objects.get(name='React'),
-                        Skill.objects.get(name='MongoDB'),
-                    )
-                elif i == 2:  # E-commerce API
-                    project.technologies.add(
-                        Skill.objects.get(name='Node.js'),
-                        Skill.objects.get(name='Express.js'),
-                        Skill.objects.get(name='MongoDB'),
-                    )
-                
-                self.stdout.write(self.style.SUCCESS(f'Created project: {project.title}'))
+        projects = loader.upsert(Project, projects_data, ['title'])
+
+        # Add some technologies
+        project_technologies = {
+            'Student Management System': ['Python', 'Django', 'React', 'PostgreSQL'],
+            'AI Tutor Platform': ['Python', 'React', 'MongoDB'],
+            'E-commerce API': ['Node.js', 'Express.js', 'MongoDB'],
+        }
+        loader.link(Project.technologies, {
+            projects[title]: [skills[name] for name in names]
+            for title, names in project_technologies.items()
+        })
+        self.stdout.write(self.style.SUCCESS(f'Saved {len(projects)} projects'))
 
         # Create Experience
         experience_data = {
@@ -147,19 +124,12 @@ class Command(BaseCommand):
             'location': 'Remote',
         }
 
-        experience, created = Experience.objects.get_or_create(
-            company=experience_data['company'],
-            position=experience_data['position'],
-            defaults=experience_data
-        )
-        
-        if created:
-            experience.technologies.add(
-                Skill.objects.get(name='Python'),
-                Skill.objects.get(name='Django'),
-                Skill.objects.get(name='React'),
-            )
-            self.stdout.write(self.style.SUCCESS('Created experience'))
+        experiences = loader.upsert(Experience, [experience_data], ['company', 'position'])
+        loader.link(Experience.technologies, {
+            pk: [skills['Python'], skills['Django'], skills['React']]
+            for pk in experiences.values()
+        })
+        self.stdout.write(self.style.SUCCESS('Saved experience'))
 
         # Create Education
         education_data = {
@@ -172,14 +142,8 @@ class Command(BaseCommand):
             'description': 'Specializing in Artificial Intelligence with focus on machine learning and data science.',
         }
 
-        education, created = Education.objects.get_or_create(
-            institution=education_data['institution'],
-            degree=education_data['degree'],
-            defaults=education_data
-        )
-        
-        if created:
-            self.stdout.write(self.style.SUCCESS('Created education'))
+        loader.upsert(Education, [education_data], ['institution', 'degree'])
+        self.stdout.write(self.style.SUCCESS('Saved education'))
 
         # Create Certifications
         certifications_data = [
@@ -197,12 +161,7 @@ class Command(BaseCommand):
             },
         ]
 
-        for cert_data in certifications_data:
-            cert, created = Certification.objects.get_or_create(
-                name=cert_data['name'],
-                defaults=cert_data
-            )
-            if created:
-                self.stdout.write(self.style.SUCCESS(f'Created certification: {cert.name}'))
+        certifications = loader.upsert(Certification, certifications_data, ['name'])
+        self.stdout.write(self.style.SUCCESS(f'Saved {len(certifications)} certifications'))
 
         self.stdout.write(self.style.SUCCESS('Database seeding completed!'))
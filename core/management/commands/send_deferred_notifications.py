@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from core.models import Contact
+from core.services import NotificationService
+from datetime import timedelta
+
+
+class Command(BaseCommand):
+    help = (
+        'Send notifications that were deferred while a provider circuit breaker '
+        'was open; run it periodically (e.g. from cron)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-age-hours',
+            type=float,
+            default=24,
+            help='Give up on notifications for contacts older than this',
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options['max_age_hours'])
+        deferred = Contact.objects.exclude(pending_notifications=[])
+
+        expired = deferred.filter(created_at__lt=cutoff).update(pending_notifications=[])
+        if expired:
+            self.stdout.write(self.style.WARNING(f'Gave up on notifications for {expired} old contact(s)'))
+
+        sent = still_pending = 0
+        deliveries = []
+        for contact in deferred.filter(created_at__gte=cutoff).order_by('created_at'):
+            before = len(contact.pending_notifications)
+            pending = NotificationService.send_deferred(contact, deliveries)
+            sent += before - len(pending)
+            still_pending += len(pending)
+        NotificationService.record_deliveries(deliveries)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Sent {sent} deferred notification(s); {still_pending} still pending'
+        ))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from core.notifications import digest, enabled_channels
+from core.services import NotificationService
+
+
+class Command(BaseCommand):
+    help = (
+        'Send the digest of owner notifications queued while a digest window '
+        'was open, once the window has closed; run it periodically (e.g. from cron)'
+    )
+
+    def handle(self, *args, **options):
+        for channel in enabled_channels():
+            if not channel.digest_window or digest.window_is_open(channel):
+                continue
+            sent = NotificationService.flush_digest(channel)
+            if sent:
+                self.stdout.write(self.style.SUCCESS(f'Sent {channel.name} digest for {sent} contact(s)'))
@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from collections import defaultdict
+import json
+
+
+class Command(BaseCommand):
+    help = 'Summarize the slowest query fingerprints recorded in the slow query log'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--file',
+            default=str(getattr(settings, 'SLOW_QUERY_LOG_FILE', settings.BASE_DIR / 'logs' / 'slow_queries.log')),
+            help='Slow query log (JSON lines) to read',
+        )
+        parser.add_argument('--limit', type=int, default=10, help='Number of fingerprints to show')
+        parser.add_argument(
+            '--sort',
+            choices=['total', 'max', 'count'],
+            default='total',
+            help='Rank fingerprints by total time, worst single query or occurrences',
+        )
+        parser.add_argument('--plans', action='store_true', help='Show the latest query plan for each fingerprint')
+
+    def read_entries(self, path):
+        try:
+            log_file = open(path)
+        except OSError as exc:
+            raise CommandError(f'Cannot read {path}: {exc}')
+        with log_file:
+            for line in log_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and 'fingerprint' in entry and 'duration_ms' in entry:
+                    yield entry
+
+    def summarize(self, entries):
+        summary = defaultdict(lambda: {'count': 0, 'total': 0.0, 'max': 0.0, 'views': set()})
+        for entry in entries:
+            stats = summary[entry['fingerprint']]
+            stats['count'] += 1
+            stats['total'] += entry['duration_ms']
+            stats['max'] = max(stats['max'], entry['duration_ms'])
+            stats['views'].add(entry.get('view') or '-')
+            stats['sql'] = entry.get('normalized_sql') or entry.get('sql', '')
+            stats['plan'] = entry.get('plan')
+        return summary
+
+    def handle(self, *args, **options):
+        summary = self.summarize(self.read_entries(options['file']))
+        if not summary:
+            self.stdout.write('No slow queries recorded.')
+            return
+
+        ranked = sorted(summary.items(), key=lambda item: item[1][options['sort']], reverse=True)
+        for query_fingerprint, stats in ranked[:options['limit']]:
+            self.stdout.write(self.style.WARNING(
+                f"{query_fingerprint}  {stats['count']:5d}x  total {stats['total']:10.1f} ms  "
+                f"avg {stats['total'] / stats['count']:8.1f} ms  max {stats['max']:8.1f} ms"
+            ))
+            self.stdout.write(f"    views: {', '.join(sorted(stats['views']))}")
+            self.stdout.write(f"    {stats['sql'][:500]}")
+            if options['plans'] and stats['plan']:
+                for line in stats['plan'].splitlines():
+                    self.stdout.write(f'      {line}')
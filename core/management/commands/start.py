@@ -0,0 +1,100 @@
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+from core.health import pending_migrations
+from core.models import Profile
+import argparse
+import logging
+import os
+import sys
+import time
+
+logger = logging.getLogger('core.startup')
+
+
+def process_started_at():
+    """Wall-clock time this process was started, from /proc when available"""
+    try:
+        with open('/proc/self/stat') as stat_file:
+            # Field 22 (starttime), counted after the parenthesised command name
+            start_ticks = int(stat_file.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as uptime_file:
+            uptime = float(uptime_file.read().split()[0])
+        return time.time() - uptime + start_ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError):
+        return time.time()
+
+
+class Command(BaseCommand):
+    help = (
+        'Container entry point: apply pending migrations, seed an empty database, '
+        'warm caches and run gunicorn with a preloaded app in this process'
+    )
+
+    APP_MODULE = 'portfolio_django.wsgi:application'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--bind', default=f"0.0.0.0:{os.environ.get('PORT', '8000')}", help='Address to listen on')
+        parser.add_argument(
+            '--no-server',
+            action='store_true',
+            help='Run the startup steps without starting gunicorn',
+        )
+        parser.add_argument(
+            'gunicorn_args',
+            nargs=argparse.REMAINDER,
+            help='Extra gunicorn options, after --',
+        )
+
+    def step(self, label, func):
+        start_time = time.perf_counter()
+        result = func()
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self.stdout.write(f'{label} ({elapsed_ms:.0f} ms)')
+        return result
+
+    def migrate(self):
+        plan = pending_migrations(connections[DEFAULT_DB_ALIAS])
+        if not plan:
+            return 'No unapplied migrations'
+        call_command('migrate', interactive=False, verbosity=1, stdout=self.stdout)
+        return f'Applied {len(plan)} migration(s)'
+
+    def seed(self):
+        if Profile.objects.exists():
+            call_command('warm_caches', stdout=self.stdout)
+            return 'Database already has data'
+        self.stdout.write('Database is empty. Populating with initial data...')
+        try:
+            call_command('populate_fresher_data', stdout=self.stdout)
+        except Exception as e:
+            self.stdout.write(self.style.WARNING(f'Failed to populate data: {e}'))
+            self.stdout.write('You can run "python manage.py populate_fresher_data" manually.')
+            return 'Seeding failed'
+        return 'Populated database with initial data'
+
+    def run_gunicorn(self, bind, extra_args):
+        from gunicorn.app.wsgiapp import WSGIApplication
+
+        if extra_args and extra_args[0] == '--':
+            extra_args = extra_args[1:]
+        # Workers fork from this process, so they must not share its sockets
+        connections.close_all()
+        sys.argv = ['gunicorn', '--preload', '--bind', bind, *extra_args, self.APP_MODULE]
+        WSGIApplication('%(prog)s [OPTIONS] [APP_MODULE]', prog='gunicorn').run()
+
+    def handle(self, *args, **options):
+        started_at = process_started_at()
+        self.stdout.write(self.step('Checking migrations', self.migrate))
+        self.stdout.write(self.step('Checking initial data', self.seed))
+
+        ready_ms = (time.time() - started_at) * 1000
+        logger.info('Startup checks finished %.0f ms after process start', ready_ms, extra={'startup_ms': round(ready_ms)})
+        self.stdout.write(self.style.SUCCESS(f'Startup checks finished {ready_ms:.0f} ms after process start'))
+
+        if options['no_server']:
+            return
+        # Read by the when_ready hook in gunicorn.conf.py to log the full cold start
+        os.environ['STARTUP_STARTED_AT'] = str(started_at)
+        self.stdout.write('Starting Gunicorn...')
+        self.run_gunicorn(options['bind'], options['gunicorn_args'])
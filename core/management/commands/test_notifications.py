@@ -1,12 +1,26 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
+from django.db import connection
+from django.test.utils import override_settings
+from core.benchmark import percentile
+from core.notifications.breaker import CircuitBreaker
+from core.notifications.fakes import FakeSMTPServer, FakeTwilioServer
 from core.services import NotificationService
-from core.models import Contact
+from core.models import Contact, NotificationDelivery
 from datetime import datetime
+import queue
+import threading
+import time
 
 
 class Command(BaseCommand):
-    help = 'Test email and SMS notification functionality'
+    help = (
+        'Test email and SMS notification functionality, or benchmark the notification '
+        'pipeline against in-process fake SMTP and Twilio servers with --benchmark'
+    )
+
+    # Breaker names used while benchmarking, so fake failures never open the real ones
+    BENCHMARK_PROVIDERS = {'email': 'benchmark-smtp', 'sms': 'benchmark-twilio'}
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -19,8 +33,158 @@ class Command(BaseCommand):
             action='store_true',
             help='Test only SMS notifications',
         )
+        parser.add_argument(
+            '--benchmark',
+            type=int,
+            metavar='N',
+            help='Send N synthetic contacts through every channel against fake providers and report throughput',
+        )
+        parser.add_argument('--latency-ms', type=float, default=50.0, help='Fake provider latency per message')
+        parser.add_argument(
+            '--failure-rate',
+            type=float,
+            default=0.0,
+            help='Fraction of messages the fake providers reject (0-1)',
+        )
+        parser.add_argument('--concurrency', type=int, default=1, help='Contacts notified in parallel')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for fake provider failures')
+
+    def benchmark_settings(self, smtp, twilio):
+        return {
+            'EMAIL_BACKEND': 'django.core.mail.backends.smtp.EmailBackend',
+            'EMAIL_HOST': smtp.host,
+            'EMAIL_PORT': smtp.port,
+            'EMAIL_USE_TLS': False,
+            'EMAIL_USE_SSL': False,
+            'EMAIL_HOST_USER': 'owner@example.com',
+            'EMAIL_HOST_PASSWORD': '',
+            'TWILIO_ACCOUNT_SID': 'AC' + '0' * 32,
+            'TWILIO_AUTH_TOKEN': 'benchmark',
+            'TWILIO_PHONE_NUMBER': '+15005550006',
+            'RECIPIENT_PHONE_NUMBER': '+15005550001',
+            'ENABLE_EMAIL_NOTIFICATIONS': True,
+            'ENABLE_SMS_NOTIFICATIONS': True,
+            'NOTIFICATION_CHANNELS': {
+                'email': {
+                    'BACKEND': 'core.notifications.email.EmailChannel',
+                    'OPTIONS': {'PROVIDER': self.BENCHMARK_PROVIDERS['email']},
+                },
+                'sms': {
+                    'BACKEND': 'core.notifications.sms.TwilioSMSChannel',
+                    'OPTIONS': {'PROVIDER': self.BENCHMARK_PROVIDERS['sms'], 'API_BASE_URL': twilio.url},
+                },
+            },
+            # Every contact goes through the whole pipeline
+            'NOTIFICATION_DIGEST_WINDOW': 0,
+            'NOTIFICATION_CONFIRMATION_WINDOW': 0,
+        }
+
+    def notify(self, contact):
+        start_time = time.perf_counter()
+        NotificationService.send_contact_notifications(contact)
+        return (time.perf_counter() - start_time) * 1000
+
+    def notify_all(self, contacts, concurrency):
+        """Pipeline latency in ms of every contact, notified by ``concurrency`` threads"""
+        if concurrency <= 1:
+            return [self.notify(contact) for contact in contacts]
+
+        pending = queue.SimpleQueue()
+        for contact in contacts:
+            pending.put(contact)
+        latencies = []
+
+        def worker():
+            try:
+                while True:
+                    try:
+                        contact = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    latencies.append(self.notify(contact))
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return latencies
+
+    def reset_benchmark_breakers(self):
+        for provider in self.BENCHMARK_PROVIDERS.values():
+            CircuitBreaker.for_provider(provider).reset()
+
+    def run_benchmark(self, count, latency_ms, failure_rate, concurrency, seed):
+        if count < 1:
+            raise CommandError('--benchmark needs at least one contact')
+        if not 0 <= failure_rate <= 1:
+            raise CommandError('--failure-rate must be between 0 and 1')
+
+        smtp = FakeSMTPServer(latency_ms, failure_rate, seed).start()
+        twilio = FakeTwilioServer(latency_ms, failure_rate, seed + 1).start()
+        subject = 'Notification benchmark'
+        message = 'Synthetic contact created by test_notifications --benchmark.'
+        contacts = Contact.objects.bulk_create([
+            Contact(
+                name=f'Benchmark {number}',
+                email=f'benchmark{number}@example.com',
+                subject=subject,
+                message=message,
+                # bulk_create skips Contact.save(), which normally fills this in
+                fingerprint=Contact.content_fingerprint(f'benchmark{number}@example.com', subject, message),
+            )
+            for number in range(count)
+        ])
+        try:
+            with override_settings(**self.benchmark_settings(smtp, twilio)):
+                self.reset_benchmark_breakers()
+                start_time = time.perf_counter()
+                latencies = self.notify_all(contacts, concurrency)
+                elapsed = time.perf_counter() - start_time
+                self.reset_benchmark_breakers()
+            deliveries = list(
+                NotificationDelivery.objects.filter(contact__in=contacts).values_list('channel', 'status', 'latency_ms')
+            )
+        finally:
+            Contact.objects.filter(pk__in=[contact.pk for contact in contacts]).delete()
+            smtp.stop()
+            twilio.stop()
+
+        messages = smtp.messages + twilio.messages
+        self.stdout.write(
+            f'Notified {count} contacts in {elapsed:.2f} s with concurrency {concurrency}: '
+            f'{count / elapsed:.1f} contacts/s, {messages / elapsed:.1f} provider messages/s'
+        )
+        self.stdout.write(
+            f'Pipeline latency: p50 {percentile(latencies, 0.50):.1f} ms, p95 {percentile(latencies, 0.95):.1f} ms, '
+            f'p99 {percentile(latencies, 0.99):.1f} ms, max {max(latencies):.1f} ms'
+        )
+        for channel in self.BENCHMARK_PROVIDERS:
+            rows = [row for row in deliveries if row[0] == channel]
+            provider_ms = [row[2] for row in rows if row[2] is not None]
+            counts = {status: sum(1 for row in rows if row[1] == status) for status in ('sent', 'failed', 'deferred')}
+            self.stdout.write(
+                f"{channel}: {counts['sent']} sent, {counts['failed']} failed, {counts['deferred']} deferred; "
+                f'provider latency p50 {percentile(provider_ms, 0.50):.1f} ms, p95 {percentile(provider_ms, 0.95):.1f} ms'
+            )
+        self.stdout.write(
+            f'SMTP: {smtp.connections} connections, {smtp.messages} messages ({smtp.failures} rejected); '
+            f'Twilio: {twilio.connections} connections, {twilio.messages} messages ({twilio.failures} rejected)'
+        )
 
     def handle(self, *args, **options):
+        if options['benchmark'] is not None:
+            self.run_benchmark(
+                options['benchmark'],
+                options['latency_ms'],
+                options['failure_rate'],
+                options['concurrency'],
+                options['seed'],
+            )
+            return
+
         self.stdout.write('Testing notification system...')
         
         # Create a test contact
@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand
+from core import spam
+from core.models import Contact
+
+
+class Command(BaseCommand):
+    help = (
+        "Train the spam filter's naive Bayes model on the contacts marked as spam "
+        'and not spam in the admin, and report how long scoring a message takes'
+    )
+
+    def handle(self, *args, **options):
+        model = spam.train()
+        spam_count = Contact.objects.filter(is_spam=True).count()
+        ham_count = Contact.objects.filter(is_spam=False).count()
+        if model is None:
+            minimum = spam.spam_settings()['BAYES_MIN_SAMPLES']
+            self.stdout.write(self.style.WARNING(
+                f'Not trained: {spam_count} spam and {ham_count} other contact(s), '
+                f'at least {minimum} of each are needed'
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'Trained on {spam_count} spam and {ham_count} other contact(s), '
+                f'{len(model.spam_counts.keys() | model.ham_counts.keys())} tokens'
+            ))
+            if not spam.spam_settings()['BAYES']:
+                self.stdout.write('SPAM_FILTER["BAYES"] is off, so the model is not used yet')
+
+        messages = list(Contact.objects.values_list('message', flat=True)[:1000])
+        if messages:
+            start_time = time.perf_counter()
+            for message in messages:
+                spam.score(message)
+            elapsed = time.perf_counter() - start_time
+            self.stdout.write(f'Scored {len(messages)} message(s) in {elapsed * 1e6 / len(messages):.1f} µs each')
@@ -0,0 +1,71 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from core.blocklist import DomainBlocklist
+from pathlib import Path
+from urllib.request import urlopen
+import os
+import tempfile
+
+
+class Command(BaseCommand):
+    help = (
+        'Download the community-maintained disposable email domain list into the '
+        "contact form's blocklist; running workers reload it without a restart"
+    )
+
+    DEFAULT_URL = (
+        'https://raw.githubusercontent.com/disposable-email-domains/disposable-email-domains/'
+        'main/disposable_email_blocklist.conf'
+    )
+    DEFAULT_OUTPUT = Path(settings.BASE_DIR) / 'core' / 'data' / 'disposable_domains_upstream.txt'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default=self.DEFAULT_URL, help='Where to download the list from')
+        parser.add_argument('--output', default=str(self.DEFAULT_OUTPUT), help='Blocklist file to replace')
+        parser.add_argument('--timeout', type=float, default=30, help='Download timeout in seconds')
+        parser.add_argument(
+            '--min-entries',
+            type=int,
+            default=1000,
+            help='Refuse to replace the file with a list shorter than this (e.g. an error page)',
+        )
+
+    def download(self, url, timeout):
+        try:
+            with urlopen(url, timeout=timeout) as response:
+                return response.read().decode('utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            raise CommandError(f'Failed to download {url}: {e}')
+
+    def write(self, path, text):
+        """Replace ``path`` in one step, so workers never load a half-written file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as temp_file:
+                temp_file.write(text)
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def handle(self, *args, **options):
+        text = self.download(options['url'], options['timeout'])
+        blocklist = DomainBlocklist.from_text(text)
+        if len(blocklist) < options['min_entries']:
+            raise CommandError(
+                f"Only {len(blocklist)} entries in {options['url']}, expected at least "
+                f"{options['min_entries']}; keeping the current file"
+            )
+
+        header = (
+            f"# Downloaded from {options['url']}\n"
+            f'# on {timezone.now():%Y-%m-%d %H:%M} UTC by manage.py update_disposable_domains.\n'
+            '# Do not edit: the next update replaces this file. Add local entries to\n'
+            '# disposable_domains.txt instead.\n\n'
+        )
+        self.write(options['output'], header + text)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {len(blocklist)} entries to {options['output']}"))
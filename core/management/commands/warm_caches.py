@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand
+from django.conf import settings
+from django.test import Client
+from django.urls import reverse
+from core.models import Project
+import time
+
+
+class Command(BaseCommand):
+    help = (
+        'Render every public page and API endpoint once to prime the page data '
+        'cache and compiled templates, reporting cold vs. warm timings'
+    )
+
+    # Public routes that take no arguments
+    PUBLIC_URL_NAMES = ['index', 'about', 'projects', 'contact', 'api_skills', 'api_projects']
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url',
+            action='append',
+            default=[],
+            help='Additional path to warm (can be given more than once)',
+        )
+
+    def get_urls(self, extra_urls):
+        urls = [reverse(name) for name in self.PUBLIC_URL_NAMES]
+        projects_url = reverse('projects')
+        urls += [f'{projects_url}?category={category}' for category, _ in Project.CATEGORY_CHOICES]
+        return urls + extra_urls
+
+    def get_host(self):
+        for host in settings.ALLOWED_HOSTS:
+            if host and '*' not in host and not host.startswith('.'):
+                return host
+        return 'localhost'
+
+    def fetch(self, client, url):
+        start_time = time.perf_counter()
+        response = client.get(url, secure=settings.SECURE_SSL_REDIRECT)
+        return response.status_code, (time.perf_counter() - start_time) * 1000
+
+    def handle(self, *args, **options):
+        client = Client(HTTP_HOST=self.get_host(), raise_request_exception=False)
+        self.stdout.write('Warming caches...')
+
+        failures = 0
+        total_start = time.perf_counter()
+        for url in self.get_urls(options['url']):
+            status, cold_ms = self.fetch(client, url)
+            _, warm_ms = self.fetch(client, url)
+            line = f'{status} {url:<32} cold {cold_ms:8.1f} ms   warm {warm_ms:8.1f} ms'
+            if status >= 400:
+                failures += 1
+                self.stdout.write(self.style.WARNING(line))
+            else:
+                self.stdout.write(line)
+
+        total_ms = (time.perf_counter() - total_start) * 1000
+        if failures:
+            self.stdout.write(self.style.WARNING(f'Cache warmup finished in {total_ms:.0f} ms with {failures} failing URL(s)'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Cache warmup finished in {total_ms:.0f} ms'))
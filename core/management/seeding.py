@@ -0,0 +1,135 @@
+"""
+Shared bulk loader for the seed_data and populate_* management commands.
+
+Each model is written with a single upsert statement keyed on its natural
+key, M2M links are inserted straight into the through table, and the whole
+run happens inside one transaction.
+"""
+import time
+
+from cacheops import invalidate_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.cache import invalidate_content
+
+
+class BulkLoader:
+    """Upserts rows by natural key and bulk-inserts M2M links"""
+
+    def __init__(self):
+        self.touched_models = set()
+
+    def _has_unique_key(self, model, key_fields):
+        """Whether the database enforces uniqueness on exactly ``key_fields``"""
+        if len(key_fields) == 1 and model._meta.get_field(key_fields[0]).unique:
+            return True
+        return any(
+            set(getattr(constraint, 'fields', ())) == set(key_fields)
+            for constraint in model._meta.total_unique_constraints
+        ) or any(set(fields) == set(key_fields) for fields in model._meta.unique_together)
+
+    def upsert(self, model, rows, key_fields):
+        """
+        Insert or update ``rows`` (a list of field dicts) matched on
+        ``key_fields`` and return ``{natural key: pk}``. Single-field natural
+        keys are returned as plain values, composite ones as tuples.
+
+        Uses ``INSERT ... ON CONFLICT DO UPDATE`` when the key is backed by a
+        unique constraint, otherwise one lookup plus ``bulk_create`` and
+        ``bulk_update``.
+        """
+        if not rows:
+            return {}
+        self.touched_models.add(model)
+        update_fields = sorted({field for row in rows for field in row} - set(key_fields))
+        natural_key = lambda values: tuple(getattr(values[field], 'pk', values[field]) for field in key_fields)
+
+        if self._has_unique_key(model, key_fields):
+            model.objects.bulk_create(
+                [model(**row) for row in rows],
+                update_conflicts=bool(update_fields),
+                ignore_conflicts=not update_fields,
+                unique_fields=key_fields if update_fields else None,
+                update_fields=update_fields or None,
+            )
+            return self._unwrap(self.lookup(model, [natural_key(row) for row in rows], key_fields))
+
+        existing = self.lookup(model, [natural_key(row) for row in rows], key_fields)
+        to_create, to_update = [], []
+        for row in rows:
+            pk = existing.get(natural_key(row))
+            if pk is None:
+                to_create.append(model(**row))
+            else:
+                to_update.append(model(pk=pk, **row))
+        if to_create:
+            model.objects.bulk_create(to_create)
+        if to_update and update_fields:
+            model.objects.bulk_update(to_update, update_fields)
+        return self._unwrap(self.lookup(model, [natural_key(row) for row in rows], key_fields))
+
+    def _unwrap(self, pks):
+        return {key[0] if len(key) == 1 else key: pk for key, pk in pks.items()}
+
+    def lookup(self, model, keys, key_fields):
+        """Map natural keys to primary keys in a single query"""
+        wanted = set(keys)
+        # Narrow on the first key column, then match the full key in Python
+        queryset = model.objects.filter(**{f'{key_fields[0]}__in': {key[0] for key in wanted}})
+        pks = {}
+        for *key_values, pk in queryset.values_list(*key_fields, 'pk'):
+            if tuple(key_values) in wanted:
+                pks[tuple(key_values)] = pk
+        return pks
+
+    def link(self, relation, links):
+        """
+        Bulk insert M2M rows for a forward relation such as
+        ``Project.technologies``. ``links`` maps source pks to target pks.
+        """
+        field = relation.field
+        through = field.remote_field.through
+        source, target = field.m2m_column_name(), field.m2m_reverse_name()
+        rows = [
+            through(**{source: source_pk, target: target_pk})
+            for source_pk, target_pks in links.items()
+            for target_pk in target_pks
+        ]
+        if rows:
+            through.objects.bulk_create(rows, ignore_conflicts=True)
+            self.touched_models.add(through)
+        return len(rows)
+
+    def invalidate(self):
+        """Invalidate caches for everything written; bulk writes bypass signals"""
+        for model in self.touched_models:
+            invalidate_model(model)
+        transaction.on_commit(invalidate_content)
+
+
+class SeedCommand(BaseCommand):
+    """Base class for seed commands: one transaction, timing and cache warmup"""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--skip-warmup',
+            action='store_true',
+            help='Do not run warm_caches after seeding',
+        )
+
+    def seed(self, loader, **options):
+        raise NotImplementedError('Seed commands must implement seed()')
+
+    def handle(self, *args, **options):
+        start_time = time.perf_counter()
+        loader = BulkLoader()
+        with transaction.atomic():
+            self.seed(loader, **options)
+            loader.invalidate()
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self.stdout.write(f'Seeding took {elapsed_ms:.0f} ms')
+
+        if not options['skip_warmup']:
+            call_command('warm_caches', stdout=self.stdout)
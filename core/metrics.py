@@ -0,0 +1,153 @@
+"""
+Prometheus metrics for the portfolio site.
+
+``PerformanceMiddleware`` feeds request latency, status codes and query
+counts; ``get_or_regenerate`` feeds page data cache lookups,
+``NotificationService`` feeds per-channel send latency and outcomes, the
+email channel counts deduplicated confirmations, the contact view counts
+duplicate submissions and the hooks in gunicorn.conf.py feed worker
+lifecycle events. ``metrics_view`` exposes them in the text exposition
+format.
+
+Under gunicorn set ``PROMETHEUS_MULTIPROC_DIR`` to an empty directory before
+the workers start: every worker then writes its samples there and a scrape
+aggregates all of them, whichever worker serves it.
+"""
+import hmac
+import os
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess,
+)
+
+REQUEST_LATENCY = Histogram(
+    'portfolio_request_duration_seconds',
+    'Request latency by view',
+    ['view', 'method'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+REQUESTS = Counter(
+    'portfolio_requests',
+    'Requests by view and status code',
+    ['view', 'method', 'status'],
+)
+REQUEST_QUERIES = Histogram(
+    'portfolio_request_db_queries',
+    'Database queries per request by view',
+    ['view'],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200),
+)
+CACHE_LOOKUPS = Counter(
+    'portfolio_cache_lookups',
+    'Page data cache lookups; hit ratio is hit / (hit + miss)',
+    ['result'],
+)
+NOTIFICATION_LATENCY = Histogram(
+    'portfolio_notification_duration_seconds',
+    'Notification send latency by channel',
+    ['channel'],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+NOTIFICATIONS = Counter(
+    'portfolio_notifications',
+    'Notification sends by channel and result (sent/failed/deferred/skipped)',
+    ['channel', 'result'],
+)
+CONFIRMATIONS_SUPPRESSED = Counter(
+    'portfolio_confirmations_suppressed',
+    'Confirmation emails skipped because the address got one within the dedupe window',
+)
+CONTACT_DUPLICATES = Counter(
+    'portfolio_contact_duplicates',
+    'Contact submissions dropped as repeats of one within CONTACT_DUPLICATE_WINDOW',
+)
+WORKER_EVENTS = Counter(
+    'portfolio_gunicorn_worker_events',
+    'Gunicorn worker lifecycle events (boot/timeout/exit), from gunicorn.conf.py hooks',
+    ['event'],
+)
+
+
+def _enabled():
+    return getattr(settings, 'METRICS_ENABLED', True)
+
+
+def observe_request(request, response, duration_ms, db_queries):
+    if not _enabled():
+        return
+    resolver_match = getattr(request, 'resolver_match', None)
+    view = (resolver_match.url_name if resolver_match else None) or 'unmatched'
+    REQUEST_LATENCY.labels(view, request.method).observe(duration_ms / 1000)
+    REQUESTS.labels(view, request.method, str(response.status_code)).inc()
+    REQUEST_QUERIES.labels(view).observe(db_queries)
+
+
+def observe_cache_lookup(hit):
+    if _enabled():
+        CACHE_LOOKUPS.labels('hit' if hit else 'miss').inc()
+
+
+def observe_notification(channel, duration_seconds, sent):
+    if not _enabled():
+        return
+    NOTIFICATION_LATENCY.labels(channel).observe(duration_seconds)
+    NOTIFICATIONS.labels(channel, 'sent' if sent else 'failed').inc()
+
+
+def observe_notification_deferred(channel):
+    if _enabled():
+        NOTIFICATIONS.labels(channel, 'deferred').inc()
+
+
+def observe_notification_skipped(channel):
+    if _enabled():
+        NOTIFICATIONS.labels(channel, 'skipped').inc()
+
+
+def observe_confirmation_suppressed():
+    if _enabled():
+        CONFIRMATIONS_SUPPRESSED.inc()
+
+
+def observe_contact_duplicate():
+    if _enabled():
+        CONTACT_DUPLICATES.inc()
+
+
+def observe_worker_event(event):
+    if _enabled():
+        WORKER_EVENTS.labels(event).inc()
+
+
+def _client_ip(request):
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def can_scrape(request):
+    """Staff users, whitelisted IPs and holders of METRICS_TOKEN may scrape"""
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token:
+        header = request.META.get('HTTP_AUTHORIZATION', '')
+        if hmac.compare_digest(header.encode(), f'Bearer {token}'.encode()):
+            return True
+    if _client_ip(request) in getattr(settings, 'METRICS_ALLOWED_IPS', []):
+        return True
+    user = getattr(request, 'user', None)
+    return bool(user is not None and user.is_staff)
+
+
+def metrics_view(request):
+    """Prometheus text exposition of every metric, aggregated across workers"""
+    if not _enabled():
+        return HttpResponse(status=404)
+    if not can_scrape(request):
+        return HttpResponseForbidden('Forbidden')
+
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.5 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_achievement_blog_service_testimonial_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['order', 'name'], name='core_skill_order_585aca_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['featured', 'order', 'name'], name='core_skill_feature_6232e6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['category', 'order', 'name'], name='core_skill_categor_9b1a3e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-featured', '-completed_date', 'order'], name='core_projec_feature_093416_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['category', '-featured', '-completed_date', 'order'], name='core_projec_categor_a1e612_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['-current', '-start_date'], name='core_experi_current_bb394b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(fields=['-current', '-start_date'], name='core_educat_current_cebdb0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(fields=['-issue_date'], name='core_certif_issue_d_26eacb_idx'),
+        ),
+    ]
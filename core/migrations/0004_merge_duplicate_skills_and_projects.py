@@ -0,0 +1,46 @@
+# Generated by Django 5.2.5 on 2026-10-19 12:30
+
+from django.db import migrations, models
+
+
+def merge_duplicate_natural_keys(apps, schema_editor):
+    """Make Skill.name and Project.title unique before adding the constraints"""
+    Skill = apps.get_model('core', 'Skill')
+    Project = apps.get_model('core', 'Project')
+    Experience = apps.get_model('core', 'Experience')
+    Blog = apps.get_model('core', 'Blog')
+
+    # Duplicate skills are merged into the oldest row, keeping their links
+    for name in Skill.objects.values('name').annotate(n=models.Count('id')).filter(n__gt=1).values_list('name', flat=True):
+        keep, *duplicates = Skill.objects.filter(name=name).order_by('id')
+        for duplicate in duplicates:
+            for through in (Project.technologies.through, Experience.technologies.through, Blog.tags.through):
+                for link in through.objects.filter(skill=duplicate):
+                    through.objects.get_or_create(skill=keep, **{
+                        field.name: getattr(link, field.name)
+                        for field in through._meta.fields
+                        if field.name not in ('id', 'skill')
+                    })
+            duplicate.delete()
+
+    # Duplicate projects keep their content under a disambiguated title
+    for title in Project.objects.values('title').annotate(n=models.Count('id')).filter(n__gt=1).values_list('title', flat=True):
+        for duplicate in Project.objects.filter(title=title).order_by('id')[1:]:
+            # An existing "Title (5)" must not be reused, or the unique constraint fails
+            suffix, attempt = f' ({duplicate.pk})', 1
+            while Project.objects.filter(title=f'{title[:200 - len(suffix)]}{suffix}').exists():
+                attempt += 1
+                suffix = f' ({duplicate.pk}-{attempt})'
+            duplicate.title = f'{title[:200 - len(suffix)]}{suffix}'
+            duplicate.save(update_fields=['title'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_skill_project_experience_education_certification_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_natural_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-19 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_merge_duplicate_skills_and_projects'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='skill',
+            name='name',
+            field=models.CharField(max_length=50, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='title',
+            field=models.CharField(max_length=200, unique=True),
+        ),
+    ]
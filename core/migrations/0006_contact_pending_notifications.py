@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 13:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_skill_name_project_title_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='pending_notifications',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
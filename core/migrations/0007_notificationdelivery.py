@@ -0,0 +1,33 @@
+# Generated by Django 5.2.5 on 2026-10-19 14:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_contact_pending_notifications'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationDelivery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('channel', models.CharField(max_length=50)),
+                ('provider', models.CharField(blank=True, max_length=50)),
+                ('status', models.CharField(choices=[('sent', 'Sent'), ('failed', 'Failed'), ('deferred', 'Deferred')], max_length=20)),
+                ('attempt', models.PositiveSmallIntegerField(default=1)),
+                ('latency_ms', models.FloatField(blank=True, null=True)),
+                ('provider_message_id', models.CharField(blank=True, max_length=255)),
+                ('error_class', models.CharField(blank=True, max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('contact', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deliveries', to='core.contact')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['channel', 'created_at'], name='core_notifi_channel_fa93d8_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 15:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_notificationdelivery'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notificationdelivery',
+            name='status',
+            field=models.CharField(choices=[('sent', 'Sent'), ('failed', 'Failed'), ('deferred', 'Deferred'), ('queued', 'Queued for digest')], max_length=20),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_notificationdelivery_queued_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='is_spam',
+            field=models.BooleanField(default=False),
+        ),
+    ]
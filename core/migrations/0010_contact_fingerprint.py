@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-19 17:40
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def fill_fingerprints(apps, schema_editor):
+    # Same normalization as Contact.content_fingerprint
+    Contact = apps.get_model('core', 'Contact')
+    contacts = list(Contact.objects.filter(fingerprint='').only('email', 'subject', 'message'))
+    for contact in contacts:
+        normalized = '\x00'.join(
+            ' '.join(value.lower().split()) for value in (contact.email, contact.subject, contact.message)
+        )
+        contact.fingerprint = hashlib.sha256(normalized.encode()).hexdigest()
+    Contact.objects.bulk_update(contacts, ['fingerprint'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_contact_is_spam'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.RunPython(fill_fingerprints, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['fingerprint', 'created_at'], name='core_contac_fingerp_9c7954_idx'),
+        ),
+    ]
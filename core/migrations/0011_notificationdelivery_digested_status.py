@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_contact_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notificationdelivery',
+            name='status',
+            field=models.CharField(choices=[('sent', 'Sent'), ('failed', 'Failed'), ('deferred', 'Deferred'), ('queued', 'Queued for digest'), ('digested', 'Sent in digest')], max_length=20),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
+import hashlib
 
 
 class Profile(models.Model):
@@ -30,7 +31,7 @@ class Skill(models.Model):
         ('other', 'Other'),
     ]
     
-    name = models.CharField(max_length=50)
+    name = models.CharField(max_length=50, unique=True)
     category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
     proficiency = models.IntegerField(default=80)  # 0-100
     icon = models.CharField(max_length=50, blank=True)  # Font Awesome class
@@ -39,6 +40,11 @@ class Skill(models.Model):
     
     class Meta:
         ordering = ['order', 'name']
+        indexes = [
+            models.Index(fields=['order', 'name']),
+            models.Index(fields=['featured', 'order', 'name']),
+            models.Index(fields=['category', 'order', 'name']),
+        ]
     
     def __str__(self):
         return self.name
@@ -54,7 +60,7 @@ class Project(models.Model):
         ('other', 'Other'),
     ]
     
-    title = models.CharField(max_length=200)
+    title = models.CharField(max_length=200, unique=True)
     description = models.TextField()
     category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
     image = models.ImageField(upload_to='projects/', blank=True)
@@ -67,6 +73,10 @@ class Project(models.Model):
     
     class Meta:
         ordering = ['-featured', '-completed_date', 'order']
+        indexes = [
+            models.Index(fields=['-featured', '-completed_date', 'order']),
+            models.Index(fields=['category', '-featured', '-completed_date', 'order']),
+        ]
     
     def __str__(self):
         return self.title
@@ -86,6 +96,9 @@ class Experience(models.Model):
     
     class Meta:
         ordering = ['-current', '-start_date']
+        indexes = [
+            models.Index(fields=['-current', '-start_date']),
+        ]
     
     def __str__(self):
         return f"{self.position} at {self.company}"
@@ -103,6 +116,9 @@ class Education(models.Model):
     
     class Meta:
         ordering = ['-current', '-start_date']
+        indexes = [
+            models.Index(fields=['-current', '-start_date']),
+        ]
     
     def __str__(self):
         return f"{self.degree} from {self.institution}"
@@ -119,6 +135,9 @@ class Certification(models.Model):
     
     class Meta:
         ordering = ['-issue_date']
+        indexes = [
+            models.Index(fields=['-issue_date']),
+        ]
     
     def __str__(self):
         return self.name
@@ -132,9 +151,62 @@ class Contact(models.Model):
     message = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     is_read = models.BooleanField(default=False)
+    # Marked by the owner in the admin; the spam filter's naive Bayes model is trained on it
+    is_spam = models.BooleanField(default=False)
+    # Channels skipped while their provider's circuit breaker was open;
+    # sent later by the send_deferred_notifications command
+    pending_notifications = models.JSONField(default=list, blank=True)
+    # Hash of the normalized email, subject and message, for spotting resubmissions
+    fingerprint = models.CharField(max_length=64, blank=True, editable=False)
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['fingerprint', 'created_at']),
+        ]
     
     def __str__(self):
         return f"Message from {self.name} - {self.subject}"
+    
+    @staticmethod
+    def content_fingerprint(email, subject, message):
+        """Same for submissions differing only in case and whitespace"""
+        normalized = '\x00'.join(' '.join(value.lower().split()) for value in (email, subject, message))
+        return hashlib.sha256(normalized.encode()).hexdigest()
+    
+    def save(self, *args, **kwargs):
+        if not self.fingerprint:
+            self.fingerprint = self.content_fingerprint(self.email, self.subject, self.message)
+        super().save(*args, **kwargs)
+
+
+class NotificationDelivery(models.Model):
+    """One attempt to send a contact notification through a channel"""
+    STATUS_CHOICES = [
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+        ('deferred', 'Deferred'),
+        ('queued', 'Queued for digest'),
+        # Sent in a digest whose attempt, latency and outcome are on another row
+        ('digested', 'Sent in digest'),
+    ]
+    
+    contact = models.ForeignKey(Contact, on_delete=models.CASCADE, related_name='deliveries')
+    channel = models.CharField(max_length=50)
+    provider = models.CharField(max_length=50, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES)
+    attempt = models.PositiveSmallIntegerField(default=1)
+    # Time spent in the channel's send, i.e. waiting on the provider
+    latency_ms = models.FloatField(null=True, blank=True)
+    provider_message_id = models.CharField(max_length=255, blank=True)
+    error_class = models.CharField(max_length=100, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['channel', 'created_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.channel} {self.status} for contact {self.contact_id} (attempt {self.attempt})"
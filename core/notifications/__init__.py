@@ -0,0 +1,57 @@
+"""
+Notification channels for contact form submissions.
+
+Channels are configured in ``settings.NOTIFICATION_CHANNELS``, much like
+``CACHES``::
+
+    NOTIFICATION_CHANNELS = {
+        'email': {'BACKEND': 'core.notifications.email.EmailChannel'},
+        'sms': {'BACKEND': 'core.notifications.sms.TwilioSMSChannel', 'ENABLED': False},
+        'file': {'BACKEND': 'core.notifications.file.FileChannel', 'OPTIONS': {'PATH': '...'}},
+    }
+
+A backend's module is imported the first time its channel is used, so the
+Twilio SDK is never loaded by processes that do not send SMS.
+"""
+import threading
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+_channels = {}
+_lock = threading.Lock()
+
+
+def channel_names():
+    return list(getattr(settings, 'NOTIFICATION_CHANNELS', {}))
+
+
+def get_channel(name):
+    """The configured channel called ``name``, importing its backend on first use"""
+    channel = _channels.get(name)
+    if channel is not None:
+        return channel
+    with _lock:
+        if name not in _channels:
+            config = getattr(settings, 'NOTIFICATION_CHANNELS', {})[name]
+            backend = import_string(config['BACKEND'])
+            _channels[name] = backend(
+                name,
+                enabled=config.get('ENABLED', True),
+                options=config.get('OPTIONS', {}),
+            )
+        return _channels[name]
+
+
+def enabled_channels():
+    """Enabled channels in settings order"""
+    return [channel for channel in map(get_channel, channel_names()) if channel.enabled]
+
+
+@receiver(setting_changed)
+def reset_channels(setting, **kwargs):
+    if setting == 'NOTIFICATION_CHANNELS':
+        with _lock:
+            _channels.clear()
@@ -0,0 +1,97 @@
+from django.conf import settings
+
+from .breaker import CircuitBreaker
+
+
+class DeliveryResult:
+    """Outcome of one send, with what the provider told us about it"""
+
+    def __init__(self, sent, message_id='', error=None):
+        self.sent = sent
+        self.message_id = message_id
+        self.error = error
+
+    @property
+    def error_class(self):
+        return self.error.__class__.__name__ if self.error is not None else ''
+
+
+class BaseChannel:
+    """
+    A way of telling someone about a contact submission.
+
+    Subclasses implement ``send(contact)`` and return True when the
+    notification was handed to the provider; provider errors are logged and
+    reported as False rather than raised. Channels that can report the
+    provider's message id or the error they caught implement
+    ``deliver(contact)`` instead and return a ``DeliveryResult``.
+
+    Channels backed by a remote service name it in ``provider`` (or the
+    ``PROVIDER`` option) and get a circuit breaker shared by every channel
+    using that provider.
+
+    Channels with ``supports_digest`` can coalesce owner notifications: they
+    implement ``deliver_digest(contacts)`` and, for anything that must still
+    go out per contact (the submitter's confirmation), ``deliver_confirmation``.
+    """
+
+    provider = None
+    supports_digest = False
+
+    def __init__(self, name, enabled=True, options=None):
+        self.name = name
+        self._enabled = enabled
+        self.options = options or {}
+        self.provider = self.options.get('PROVIDER', self.provider)
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    @property
+    def configured(self):
+        """False when a send would fail before reaching the provider"""
+        return True
+
+    @property
+    def breaker(self):
+        return CircuitBreaker.for_provider(self.provider) if self.provider else None
+
+    def send(self, contact):
+        if type(self).deliver is BaseChannel.deliver:
+            raise NotImplementedError('Notification channels must implement send() or deliver()')
+        return self.deliver(contact).sent
+
+    def deliver(self, contact):
+        return DeliveryResult(self.send(contact))
+
+    @property
+    def digest_window(self):
+        """Seconds owner notifications are coalesced for; 0 sends each one"""
+        if not self.supports_digest:
+            return 0
+        return self.options.get('DIGEST_WINDOW', getattr(settings, 'NOTIFICATION_DIGEST_WINDOW', 0))
+
+    def deliver_digest(self, contacts):
+        raise NotImplementedError('Channels with supports_digest must implement deliver_digest()')
+
+    def deliver_confirmation(self, contact):
+        """Send the part of ``deliver`` that is not coalesced into digests, if any"""
+        return None
+
+    def summary(self, contact):
+        """Short plain-text description of ``contact`` for SMS-sized channels"""
+        return (
+            f"New contact form submission from {contact.name}!\n"
+            f"Subject: {contact.subject}\n"
+            f"Email: {contact.email}\n"
+            f"Message: {contact.message[:100]}{'...' if len(contact.message) > 100 else ''}"
+        )
+
+    def digest_summary(self, contacts, limit=5):
+        """Short plain-text description of several contacts for SMS-sized channels"""
+        lines = [f"{len(contacts)} new contact form submission{'s' if len(contacts) != 1 else ''}:"]
+        lines += [f"- {contact.name}: {contact.subject}" for contact in contacts[:limit]]
+        if len(contacts) > limit:
+            lines.append(f"...and {len(contacts) - limit} more")
+        return "\n".join(lines)
@@ -0,0 +1,120 @@
+"""
+Circuit breakers for notification providers.
+
+Each provider (SMTP, Twilio) has one breaker whose state lives in the cache,
+so every worker sees the same state:
+
+- closed: sends go through; ``FAILURE_THRESHOLD`` failures in a row (a
+  success resets the count), within ``FAILURE_WINDOW`` seconds, open the
+  breaker
+- open: sends are skipped without touching the provider for ``COOLDOWN``
+  seconds
+- half-open: once the cooldown is over a single trial send is let through;
+  success closes the breaker, failure opens it for another cooldown
+
+Configured by ``settings.NOTIFICATION_CIRCUIT_BREAKER``.
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger('core.services')
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+DEFAULTS = {
+    'FAILURE_THRESHOLD': 5,
+    'FAILURE_WINDOW': 300,
+    'COOLDOWN': 60,
+    'CACHE_ALIAS': 'default',
+}
+
+
+class CircuitBreaker:
+    def __init__(self, provider, failure_threshold=5, failure_window=300, cooldown=60, cache_alias='default'):
+        self.provider = provider
+        self.failure_threshold = failure_threshold
+        self.failure_window = failure_window
+        self.cooldown = cooldown
+        self.cache = caches[cache_alias]
+
+    @classmethod
+    def for_provider(cls, provider):
+        config = {**DEFAULTS, **getattr(settings, 'NOTIFICATION_CIRCUIT_BREAKER', {})}
+        return cls(
+            provider,
+            failure_threshold=config['FAILURE_THRESHOLD'],
+            failure_window=config['FAILURE_WINDOW'],
+            cooldown=config['COOLDOWN'],
+            cache_alias=config['CACHE_ALIAS'],
+        )
+
+    def key(self, name):
+        return f'core:breaker:{self.provider}:{name}'
+
+    def opened_at(self):
+        return self.cache.get(self.key('opened_at'))
+
+    def failures(self):
+        return self.cache.get(self.key('failures'), 0)
+
+    def state(self):
+        opened_at = self.opened_at()
+        if opened_at is None:
+            return CLOSED
+        return OPEN if time.time() - opened_at < self.cooldown else HALF_OPEN
+
+    def allow(self):
+        """Whether a send to this provider should be attempted now"""
+        state = self.state()
+        if state == CLOSED:
+            return True
+        if state == OPEN:
+            return False
+        # Only one worker gets the trial send; the marker expires with the
+        # cooldown in case that worker dies before reporting back
+        return self.cache.add(self.key('trial'), 1, self.cooldown)
+
+    def record_success(self):
+        if self.opened_at() is not None:
+            logger.info('Circuit breaker for %s closed', self.provider)
+        self.reset()
+
+    def record_failure(self):
+        if self.state() == HALF_OPEN:
+            self.trip()
+            return
+        key = self.key('failures')
+        self.cache.add(key, 0, self.failure_window)
+        try:
+            failures = self.cache.incr(key)
+        except ValueError:  # expired between add() and incr()
+            self.cache.set(key, 1, self.failure_window)
+            failures = 1
+        if failures >= self.failure_threshold and self.opened_at() is None:
+            self.trip()
+
+    def trip(self):
+        self.cache.set(self.key('opened_at'), time.time(), None)
+        self.cache.delete_many([self.key('trial'), self.key('failures')])
+        logger.warning(
+            'Circuit breaker for %s opened; skipping it for %d seconds', self.provider, self.cooldown,
+            extra={'provider': self.provider},
+        )
+
+    def reset(self):
+        self.cache.delete_many([self.key('opened_at'), self.key('trial'), self.key('failures')])
+
+    def status(self):
+        """State for the dashboard"""
+        opened_at = self.opened_at()
+        return {
+            'provider': self.provider,
+            'state': self.state(),
+            'failures': self.failures(),
+            'retry_in': max(0, round(opened_at + self.cooldown - time.time())) if opened_at else None,
+        }
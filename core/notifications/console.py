@@ -0,0 +1,13 @@
+import sys
+
+from .base import BaseChannel
+
+
+class ConsoleChannel(BaseChannel):
+    """Write notifications to stdout; handy for local development"""
+
+    def send(self, contact):
+        stream = self.options.get('STREAM', sys.stdout)
+        stream.write(f'[{self.name}] {self.summary(contact)}\n')
+        stream.flush()
+        return True
@@ -0,0 +1,38 @@
+"""
+Digest mode for owner-facing notifications.
+
+With a digest window set (``NOTIFICATION_DIGEST_WINDOW`` or a channel's
+``DIGEST_WINDOW`` option), the first contact after a quiet period is sent
+at once and opens a window. Contacts arriving while it is open are queued
+as ``NotificationDelivery`` rows and sent as one digest once it closes:
+either by the next submission after the window or by the
+``send_notification_digests`` command, run periodically. Submitter
+confirmations are never queued.
+
+Windows and the flush lock live in the cache so every worker shares them.
+"""
+import time
+
+from django.core.cache import caches
+
+
+def _key(channel, name):
+    return f'core:digest:{channel.name}:{name}'
+
+
+def open_window(channel):
+    """Open a digest window for ``channel``; False when one is already open"""
+    return caches['default'].add(_key(channel, 'window'), time.time(), channel.digest_window)
+
+
+def window_is_open(channel):
+    return caches['default'].get(_key(channel, 'window')) is not None
+
+
+def acquire_flush_lock(channel, timeout=60):
+    """Only one worker sends a channel's digest at a time"""
+    return caches['default'].add(_key(channel, 'flush'), 1, timeout)
+
+
+def release_flush_lock(channel):
+    caches['default'].delete(_key(channel, 'flush'))
@@ -0,0 +1,128 @@
+import hashlib
+import logging
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.mail import EmailMultiAlternatives
+from django.core.mail.message import make_msgid
+from django.core.mail.utils import DNS_NAME
+from django.template.loader import render_to_string
+from django.utils.html import strip_tags
+
+from core.metrics import observe_confirmation_suppressed
+
+from .base import BaseChannel, DeliveryResult
+
+logger = logging.getLogger('core.services')
+
+
+def normalize_email(address):
+    """Lower-cased address without whitespace or a ``+tag`` in the local part"""
+    local, _, domain = address.strip().lower().rpartition('@')
+    return f"{local.split('+', 1)[0]}@{domain}" if local else domain
+
+
+class EmailChannel(BaseChannel):
+    """Notification to the site owner plus a confirmation to the submitter, over SMTP"""
+
+    provider = 'smtp'
+    supports_digest = True
+
+    @property
+    def enabled(self):
+        return self._enabled and getattr(settings, 'ENABLE_EMAIL_NOTIFICATIONS', True)
+
+    def site_name(self):
+        return self.options.get('SITE_NAME', 'Siddharth Portfolio')
+
+    def send_rendered(self, subject, template_name, recipient, **context):
+        """Render and send one email; returns its Message-ID"""
+        html_message = render_to_string(template_name, {
+            'site_name': self.site_name(),
+            **context,
+        })
+        message_id = make_msgid(domain=DNS_NAME)
+        message = EmailMultiAlternatives(
+            subject=subject,
+            body=strip_tags(html_message),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[recipient],
+            headers={'Message-ID': message_id},
+        )
+        message.attach_alternative(html_message, 'text/html')
+        message.send(fail_silently=False)
+        return message_id
+
+    @property
+    def confirmation_window(self):
+        return self.options.get('CONFIRMATION_WINDOW', getattr(settings, 'NOTIFICATION_CONFIRMATION_WINDOW', 0))
+
+    def confirmation_key(self, address):
+        digest = hashlib.sha256(normalize_email(address).encode()).hexdigest()[:32]
+        return f'core:confirmation:{digest}'
+
+    def send_confirmation(self, contact):
+        """
+        Confirmation email to the person who submitted the form, at most once
+        per address every ``confirmation_window`` seconds; returns its
+        Message-ID, or None when suppressed.
+        """
+        window = self.confirmation_window
+        key = self.confirmation_key(contact.email) if window else None
+        if key and not caches['default'].add(key, 1, window):
+            logger.info(f"Confirmation email suppressed for contact ID: {contact.id}; one was sent recently")
+            observe_confirmation_suppressed()
+            return None
+        try:
+            return self.send_rendered(
+                "Thank you for contacting me!",
+                'core/email/contact_confirmation.html',
+                contact.email,
+                contact=contact,
+            )
+        except Exception:
+            if key:
+                # Let the next submission try again
+                caches['default'].delete(key)
+            raise
+
+    def deliver(self, contact):
+        try:
+            # Email to you (notification)
+            message_id = self.send_rendered(
+                f"New Contact Form Submission: {contact.subject}",
+                'core/email/contact_notification.html',
+                settings.EMAIL_HOST_USER,
+                contact=contact,
+            )
+            self.send_confirmation(contact)
+            logger.info(f"Email notifications sent successfully for contact ID: {contact.id}")
+            return DeliveryResult(True, message_id)
+
+        except Exception as e:
+            logger.error(f"Failed to send email notification: {str(e)}")
+            return DeliveryResult(False, error=e)
+
+    def deliver_digest(self, contacts):
+        try:
+            message_id = self.send_rendered(
+                f"{len(contacts)} New Contact Form Submission{'s' if len(contacts) != 1 else ''}",
+                'core/email/contact_digest.html',
+                settings.EMAIL_HOST_USER,
+                contacts=contacts,
+            )
+            logger.info(f"Email digest sent for {len(contacts)} contacts")
+            return DeliveryResult(True, message_id)
+
+        except Exception as e:
+            logger.error(f"Failed to send email digest: {str(e)}")
+            return DeliveryResult(False, error=e)
+
+    def deliver_confirmation(self, contact):
+        try:
+            message_id = self.send_confirmation(contact)
+            return DeliveryResult(True, message_id) if message_id else None
+
+        except Exception as e:
+            logger.error(f"Failed to send confirmation email: {str(e)}")
+            return DeliveryResult(False, error=e)
@@ -0,0 +1,150 @@
+"""
+In-process fake SMTP and Twilio servers for benchmarking the notification
+pipeline offline (``manage.py test_notifications --benchmark``).
+
+Both listen on an ephemeral localhost port, wait ``latency_ms`` before
+answering each message, fail a ``failure_rate`` fraction of them the way
+the real provider would (SMTP 451, Twilio HTTP 503) and count the
+connections and messages they receive.
+"""
+import json
+import random
+import socketserver
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeServer:
+    server_class = None
+    handler_class = None
+
+    def __init__(self, latency_ms=0, failure_rate=0.0, seed=None):
+        self.latency_ms = latency_ms
+        self.failure_rate = failure_rate
+        self.connections = 0
+        self.messages = 0
+        self.failures = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def host(self):
+        return self._server.server_address[0]
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def start(self):
+        self._server = self.server_class(('127.0.0.1', 0), self.handler_class)
+        self._server.daemon_threads = True
+        self._server.fake = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def connection_opened(self):
+        with self._lock:
+            self.connections += 1
+
+    def handle_message(self):
+        """Simulate the provider's work on one message; False when it fails"""
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        with self._lock:
+            self.messages += 1
+            failed = self._random.random() < self.failure_rate
+            if failed:
+                self.failures += 1
+        return not failed
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib/django.core.mail, without TLS or AUTH"""
+
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode())
+
+    def handle(self):
+        fake = self.server.fake
+        fake.connection_opened()
+        self.reply('220 fake-smtp ESMTP')
+        for line in self.rfile:
+            command = line.decode('ascii', 'replace').strip().split(' ', 1)[0].upper()
+            if command in ('EHLO', 'HELO'):
+                self.reply('250 fake-smtp')
+            elif command in ('MAIL', 'RCPT', 'RSET', 'NOOP'):
+                self.reply('250 OK')
+            elif command == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                for data_line in self.rfile:
+                    if data_line in (b'.\r\n', b'.\n'):
+                        break
+                if fake.handle_message():
+                    self.reply(f'250 OK queued as {uuid.uuid4().hex[:12]}')
+                else:
+                    self.reply('451 Requested action aborted: local error in processing')
+            elif command == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('502 Command not implemented')
+
+
+class _SMTPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+
+
+class FakeSMTPServer(FakeServer):
+    server_class = _SMTPServer
+    handler_class = _SMTPHandler
+
+
+class _TwilioHandler(BaseHTTPRequestHandler):
+    """Answers the Messages create call of the Twilio REST API"""
+
+    protocol_version = 'HTTP/1.1'  # keep-alive, so connection reuse shows up in the counts
+
+    def handle(self):
+        self.server.fake.connection_opened()
+        super().handle()
+
+    def respond(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if not self.path.endswith('/Messages.json'):
+            self.respond(404, {'code': 20404, 'message': 'Not found', 'status': 404})
+        elif self.server.fake.handle_message():
+            self.respond(201, {'sid': f'SM{uuid.uuid4().hex}', 'status': 'queued'})
+        else:
+            self.respond(503, {'code': 20503, 'message': 'Service unavailable', 'status': 503})
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeTwilioServer(FakeServer):
+    server_class = ThreadingHTTPServer
+    handler_class = _TwilioHandler
+
+    @property
+    def url(self):
+        return f'http://{self.host}:{self.port}'
@@ -0,0 +1,38 @@
+import json
+import logging
+import os
+import threading
+
+from django.utils import timezone
+
+from .base import BaseChannel
+
+logger = logging.getLogger('core.services')
+
+
+class FileChannel(BaseChannel):
+    """Append each notification as a JSON line to OPTIONS['PATH']"""
+
+    def __init__(self, name, enabled=True, options=None):
+        super().__init__(name, enabled, options)
+        self.path = self.options['PATH']
+        self._lock = threading.Lock()
+
+    def send(self, contact):
+        entry = {
+            'channel': self.name,
+            'sent_at': timezone.now().isoformat(),
+            'contact_id': contact.pk,
+            'name': contact.name,
+            'email': contact.email,
+            'subject': contact.subject,
+            'message': contact.message,
+        }
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with self._lock, open(self.path, 'a') as notification_file:
+                notification_file.write(json.dumps(entry) + '\n')
+            return True
+        except OSError as e:
+            logger.error(f"Failed to write notification to {self.path}: {str(e)}")
+            return False
@@ -0,0 +1,14 @@
+from .base import BaseChannel
+
+# Every notification sent through an InMemoryChannel, like django.core.mail.outbox
+outbox = []
+
+
+class InMemoryChannel(BaseChannel):
+    """Record notifications in ``outbox`` instead of sending them; for tests"""
+
+    def send(self, contact):
+        if self.options.get('FAIL'):
+            return False
+        outbox.append((self.name, contact))
+        return True
@@ -0,0 +1,61 @@
+import logging
+
+from django.conf import settings
+
+from .base import BaseChannel, DeliveryResult
+
+logger = logging.getLogger('core.services')
+
+
+class TwilioSMSChannel(BaseChannel):
+    """SMS to the site owner through Twilio; the SDK is imported on first send"""
+
+    provider = 'twilio'
+    supports_digest = True
+
+    @property
+    def enabled(self):
+        return self._enabled and getattr(settings, 'ENABLE_SMS_NOTIFICATIONS', True)
+
+    @property
+    def configured(self):
+        return all([
+            settings.TWILIO_ACCOUNT_SID,
+            settings.TWILIO_AUTH_TOKEN,
+            settings.TWILIO_PHONE_NUMBER
+        ])
+
+    def deliver(self, contact):
+        return self.send_text(self.summary(contact))
+
+    def deliver_digest(self, contacts):
+        return self.send_text(self.digest_summary(contacts))
+
+    def send_text(self, body):
+        # Check if Twilio credentials are configured
+        if not self.configured:
+            logger.warning("Twilio credentials not configured. SMS notification skipped.")
+            return DeliveryResult(False)
+
+        from twilio.base.exceptions import TwilioException
+        from twilio.rest import Client
+
+        try:
+            client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+            if self.options.get('API_BASE_URL'):
+                # e.g. the fake Twilio server used by test_notifications --benchmark
+                client.api.base_url = self.options['API_BASE_URL']
+            message = client.messages.create(
+                body=body,
+                from_=settings.TWILIO_PHONE_NUMBER,
+                to=settings.RECIPIENT_PHONE_NUMBER
+            )
+            logger.info(f"SMS notification sent successfully. SID: {message.sid}")
+            return DeliveryResult(True, message.sid)
+
+        except TwilioException as e:
+            logger.error(f"Twilio SMS error: {str(e)}")
+            return DeliveryResult(False, error=e)
+        except Exception as e:
+            logger.error(f"Failed to send SMS notification: {str(e)}")
+            return DeliveryResult(False, error=e)
@@ -0,0 +1,73 @@
+"""
+Data files that are re-read when they change on disk, so every worker picks
+up an edited phrase list or blocklist without being restarted.
+"""
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def data_lines(text):
+    """Non-blank lines of a data file, with ``#`` comments removed"""
+    lines = []
+    for line in text.splitlines():
+        line = line.split('#', 1)[0].strip()
+        if line:
+            lines.append(line)
+    return lines
+
+
+class ReloadingFile:
+    """
+    ``loader(text)`` applied to the contents of ``path``, loaded again when
+    the file's modification time changes.
+
+    The file is stat'ed at most once every ``check_interval`` seconds, so
+    reading ``value`` on the request path is normally just an attribute
+    lookup. A file that goes missing or fails to load keeps the last good
+    value; one that has never loaded gives ``loader('')``.
+    """
+
+    def __init__(self, path, loader, check_interval=30):
+        self.path = path
+        self.loader = loader
+        self.check_interval = check_interval
+        self._value = None
+        self._mtime = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def value(self):
+        now = time.monotonic()
+        if self._checked_at is None or now - self._checked_at >= self.check_interval:
+            with self._lock:
+                if self._checked_at is None or now - self._checked_at >= self.check_interval:
+                    self._refresh()
+                    self._checked_at = now
+        return self._value
+
+    def reload(self):
+        """Load the file again on the next ``value``, changed or not"""
+        with self._lock:
+            self._mtime = None
+            self._checked_at = None
+
+    def _refresh(self):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+            if mtime == self._mtime:
+                return
+            with open(self.path, encoding='utf-8') as data_file:
+                value = self.loader(data_file.read())
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to load {self.path}: {e}")
+            if self._value is None:
+                self._value = self.loader('')
+            return
+        self._value = value
+        self._mtime = mtime
+        logger.info(f"Loaded {self.path}")
@@ -1,120 +1,235 @@
-import os
 import logging
-from django.core.mail import send_mail
-from django.conf import settings
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
-from twilio.rest import Client
-from twilio.base.exceptions import TwilioException
+from django.db.models import Count, F
+from .instrumentation import timed
+from .metrics import observe_notification, observe_notification_deferred, observe_notification_skipped
+from .models import Contact, NotificationDelivery
+from .notifications import digest, enabled_channels, get_channel
+from .notifications.breaker import CLOSED, OPEN
+import time
 
 logger = logging.getLogger(__name__)
 
+# Suffix of pending_notifications entries that retry only a channel's submitter confirmation
+CONFIRMATION = ':confirmation'
+
 class NotificationService:
-    """Service class for handling email and SMS notifications"""
+    """Service class for sending contact notifications through the configured channels"""
     
     @staticmethod
-    def send_email_notification(contact):
-        """Send email notification for new contact form submission"""
-        if not getattr(settings, 'ENABLE_EMAIL_NOTIFICATIONS', True):
+    def send_via(channel, contact, deliveries, attempt=1):
+        """
+        Send through ``channel``, record its latency and outcome and append a
+        ``NotificationDelivery`` for it to ``deliveries``, which the caller
+        saves in bulk.
+
+        When the channel's provider breaker is open the send is skipped and
+        deferred; returns None in that case. While a digest window is open
+        the owner notification is queued for the digest instead. A channel
+        without provider credentials is skipped without a delivery, so it
+        does not show up as a failing provider.
+        """
+        if not channel.configured:
+            logger.warning(f"{channel.name} is not configured; skipping notification for contact ID: {contact.id}")
+            observe_notification_skipped(channel.name)
             return False
-            
+        
+        if channel.digest_window and not digest.open_window(channel):
+            return NotificationService.queue_for_digest(channel, contact, deliveries, attempt)
+        
+        breaker = channel.breaker
+        if breaker is not None and not breaker.allow():
+            NotificationService.defer(channel, contact)
+            deliveries.append(NotificationDelivery(
+                contact=contact, channel=channel.name, provider=channel.provider or '',
+                status='deferred', attempt=attempt,
+            ))
+            return None
+        
+        if channel.digest_window:
+            # This contact opened a new window; the previous one's queue goes out first
+            NotificationService.flush_digest(channel)
+        
+        start_time = time.perf_counter()
+        result = channel.deliver(contact)
+        elapsed = time.perf_counter() - start_time
+        observe_notification(channel.name, elapsed, result.sent)
+        NotificationService.record_outcome(breaker, result.sent)
+        deliveries.append(NotificationDelivery(
+            contact=contact,
+            channel=channel.name,
+            provider=channel.provider or '',
+            status='sent' if result.sent else 'failed',
+            attempt=attempt,
+            latency_ms=round(elapsed * 1000, 3),
+            provider_message_id=result.message_id or '',
+            error_class=result.error_class,
+        ))
+        return result.sent
+    
+    @staticmethod
+    def record_outcome(breaker, sent):
+        if breaker is not None:
+            if sent:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+    
+    @staticmethod
+    def queue_for_digest(channel, contact, deliveries, attempt=1):
+        """Queue the owner notification for the next digest; confirmations still go out now"""
+        breaker = channel.breaker if channel.configured else None
+        if breaker is None or breaker.state() == CLOSED:
+            NotificationService.send_confirmation(channel, contact, breaker)
+        else:
+            NotificationService.defer(channel, contact, confirmation=True)
+        deliveries.append(NotificationDelivery(
+            contact=contact, channel=channel.name, provider=channel.provider or '',
+            status='queued', attempt=attempt,
+        ))
+        return True
+    
+    @staticmethod
+    def send_confirmation(channel, contact, breaker=None):
+        """Send only the submitter confirmation; False when it failed"""
+        confirmation = channel.deliver_confirmation(contact)
+        if confirmation is None:
+            return True
+        NotificationService.record_outcome(breaker, confirmation.sent)
+        return confirmation.sent
+    
+    @staticmethod
+    def flush_digest(channel):
+        """
+        Send everything queued for ``channel`` as one digest. Returns the
+        number of contacts sent.
+        
+        The send is one provider attempt, so it is recorded once: on the
+        oldest queued delivery, with the others marked 'digested'. When it
+        fails a 'failed' delivery records the attempt and the queue is kept,
+        with its attempt counts raised, for the next flush.
+        """
+        if not digest.acquire_flush_lock(channel):
+            return 0
         try:
-            # Email to you (notification)
-            subject = f"New Contact Form Submission: {contact.subject}"
-            
-            # HTML email template
-            html_message = render_to_string('core/email/contact_notification.html', {
-                'contact': contact,
-                'site_name': 'Siddharth Portfolio'
-            })
-            
-            # Plain text version
-            plain_message = strip_tags(html_message)
-            
-            # Send email to you
-            send_mail(
-                subject=subject,
-                message=plain_message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[settings.EMAIL_HOST_USER],
-                html_message=html_message,
-                fail_silently=False,
+            queued = list(
+                NotificationDelivery.objects
+                .filter(channel=channel.name, status='queued')
+                .select_related('contact')
+                .order_by('created_at')
             )
+            if not queued:
+                return 0
+            breaker = channel.breaker if channel.configured else None
+            if breaker is not None and not breaker.allow():
+                return 0
             
-            # Send confirmation email to the person who submitted the form
-            confirmation_subject = "Thank you for contacting me!"
-            confirmation_html = render_to_string('core/email/contact_confirmation.html', {
-                'contact': contact,
-                'site_name': 'Siddharth Portfolio'
-            })
-            confirmation_plain = strip_tags(confirmation_html)
-            
-            send_mail(
-                subject=confirmation_subject,
-                message=confirmation_plain,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[contact.email],
-                html_message=confirmation_html,
-                fail_silently=False,
+            start_time = time.perf_counter()
+            result = channel.deliver_digest([delivery.contact for delivery in queued])
+            elapsed = time.perf_counter() - start_time
+            observe_notification(channel.name, elapsed, result.sent)
+            NotificationService.record_outcome(breaker, result.sent)
+            first, rest = queued[0], queued[1:]
+            outcome = {
+                'latency_ms': round(elapsed * 1000, 3),
+                'provider_message_id': result.message_id or '',
+                'error_class': result.error_class,
+            }
+            if not result.sent:
+                NotificationDelivery.objects.create(
+                    contact=first.contact, channel=channel.name, provider=first.provider,
+                    status='failed', attempt=first.attempt, **outcome,
+                )
+                NotificationDelivery.objects.filter(pk__in=[delivery.pk for delivery in queued]).update(
+                    attempt=F('attempt') + 1,
+                )
+                return 0
+            NotificationDelivery.objects.filter(pk=first.pk).update(status='sent', **outcome)
+            NotificationDelivery.objects.filter(pk__in=[delivery.pk for delivery in rest]).update(
+                status='digested', provider_message_id=result.message_id or '',
             )
-            
-            logger.info(f"Email notifications sent successfully for contact ID: {contact.id}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to send email notification: {str(e)}")
+            return len(queued)
+        finally:
+            digest.release_flush_lock(channel)
+    
+    @staticmethod
+    def record_deliveries(deliveries):
+        NotificationDelivery.objects.bulk_create(deliveries)
+    
+    @staticmethod
+    def defer(channel, contact, confirmation=False):
+        """Queue ``channel``, or just its confirmation, for send_deferred_notifications to retry"""
+        entry = f'{channel.name}{CONFIRMATION}' if confirmation else channel.name
+        logger.warning(
+            f"{channel.provider} circuit breaker is open; deferring {channel.name} "
+            f"{'confirmation' if confirmation else 'notification'} for contact ID: {contact.id}"
+        )
+        observe_notification_deferred(channel.name)
+        if entry not in contact.pending_notifications:
+            contact.pending_notifications = [*contact.pending_notifications, entry]
+            Contact.objects.filter(pk=contact.pk).update(pending_notifications=contact.pending_notifications)
+    
+    @staticmethod
+    def send_deferred(contact, deliveries):
+        """Retry the channels deferred for ``contact``; returns the ones still pending"""
+        attempts = dict(
+            contact.deliveries.values_list('channel').annotate(count=Count('id')).order_by()
+        )
+        pending = []
+        for entry in contact.pending_notifications:
+            name = entry.removesuffix(CONFIRMATION)
+            channel = get_channel(name)
+            if not channel.enabled:
+                continue
+            breaker = channel.breaker
+            if breaker is not None and breaker.state() == OPEN:
+                pending.append(entry)
+            elif entry.endswith(CONFIRMATION):
+                if breaker is not None and not breaker.allow():
+                    pending.append(entry)
+                elif not NotificationService.send_confirmation(channel, contact, breaker):
+                    pending.append(entry)
+            elif not NotificationService.send_via(channel, contact, deliveries, attempts.get(name, 0) + 1):
+                pending.append(entry)
+        contact.pending_notifications = pending
+        Contact.objects.filter(pk=contact.pk).update(pending_notifications=pending)
+        return pending
+    
+    @staticmethod
+    def send_channel_notification(name, contact):
+        """Send through the channel called ``name``, if it is enabled"""
+        channel = get_channel(name)
+        if not channel.enabled:
             return False
+        deliveries = []
+        sent = NotificationService.send_via(channel, contact, deliveries)
+        NotificationService.record_deliveries(deliveries)
+        return bool(sent)
+    
+    @staticmethod
+    def send_email_notification(contact):
+        """Send email notification for new contact form submission"""
+        return NotificationService.send_channel_notification('email', contact)
     
     @staticmethod
     def send_sms_notification(contact):
         """Send SMS notification for new contact form submission"""
-        if not getattr(settings, 'ENABLE_SMS_NOTIFICATIONS', True):
-            return False
-            
-        # Check if Twilio credentials are configured
-        if not all([
-            settings.TWILIO_ACCOUNT_SID,
-            settings.TWILIO_AUTH_TOKEN,
-            settings.TWILIO_PHONE_NUMBER
-        ]):
-            logger.warning("Twilio credentials not configured. SMS notification skipped.")
-            return False
-            
-        try:
-            client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
-            
-            message_body = (
-                f"New contact form submission from {contact.name}!\n"
-                f"Subject: {contact.subject}\n"
-                f"Email: {contact.email}\n"
-                f"Message: {contact.message[:100]}{'...' if len(contact.message) > 100 else ''}"
-            )
-            
-            message = client.messages.create(
-                body=message_body,
-                from_=settings.TWILIO_PHONE_NUMBER,
-                to=settings.RECIPIENT_PHONE_NUMBER
-            )
-            
-            logger.info(f"SMS notification sent successfully. SID: {message.sid}")
-            return True
-            
-        except TwilioException as e:
-            logger.error(f"Twilio SMS error: {str(e)}")
-            return False
-        except Exception as e:
-            logger.error(f"Failed to send SMS notification: {str(e)}")
-            return False
+        return NotificationService.send_channel_notification('sms', contact)
     
     @staticmethod
     def send_contact_notifications(contact):
-        """Send both email and SMS notifications for a contact form submission"""
-        email_sent = NotificationService.send_email_notification(contact)
-        sms_sent = NotificationService.send_sms_notification(contact)
+        """Send a contact form submission through every enabled channel"""
+        deliveries = []
+        with timed('notification_ms'):
+            sent = {
+                channel.name: NotificationService.send_via(channel, contact, deliveries)
+                for channel in enabled_channels()
+            }
+        NotificationService.record_deliveries(deliveries)
         
         return {
-            'email_sent': email_sent,
-            'sms_sent': sms_sent,
-            'success': email_sent or sms_sent
+            'email_sent': bool(sent.get('email')),
+            'sms_sent': bool(sent.get('sms')),
+            'channels': {name: bool(result) for name, result in sent.items()},
+            'deferred': [name for name, result in sent.items() if result is None],
+            'success': any(sent.values())
         }
-
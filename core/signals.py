@@ -0,0 +1,23 @@
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+from .cache import invalidate_content
+from .models import Profile, Skill, Project, Experience, Education, Certification
+
+# Models whose rows are rendered on the public pages
+CONTENT_MODELS = [Profile, Skill, Project, Experience, Education, Certification]
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_content_cache(sender, **kwargs):
+    """Drop cached page data whenever portfolio content changes"""
+    if sender in CONTENT_MODELS:
+        invalidate_content()
+
+
+@receiver(m2m_changed, sender=Project.technologies.through)
+@receiver(m2m_changed, sender=Experience.technologies.through)
+def invalidate_content_cache_m2m(sender, action, **kwargs):
+    """Drop cached page data when technologies are linked or unlinked"""
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_content()
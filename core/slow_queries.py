@@ -0,0 +1,125 @@
+"""
+Slow query log with EXPLAIN capture.
+
+``PerformanceMiddleware`` passes every query that takes longer than
+``SLOW_QUERY_THRESHOLD_MS`` to ``capture()``. Queries issued from views in
+``SLOW_QUERY_MODULES`` are logged to ``core.slow_queries`` with their SQL,
+parameters, calling view and query plan, at most once per
+``SLOW_QUERY_LOG_INTERVAL`` seconds per query fingerprint.
+
+``SLOW_QUERY_EXPLAIN`` selects the plan: ``'off'``, ``'plan'`` (plain
+``EXPLAIN``) or ``'analyze'``. ``EXPLAIN ANALYZE`` runs the statement again,
+so in ``'analyze'`` mode only SELECTs are analyzed, everything else gets a
+plain plan.
+"""
+import hashlib
+import logging
+import re
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+logger = logging.getLogger('core.slow_queries')
+
+# Set while running EXPLAIN so the plan query is neither captured nor timed
+_explaining = ContextVar('core_slow_query_explaining', default=False)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'\bIN \((?:\s*%s\s*,?)+\)', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def normalize(sql):
+    """SQL with literals and IN lists collapsed so similar queries compare equal"""
+    sql = _STRING_LITERAL.sub('?', sql)
+    sql = _NUMBER_LITERAL.sub('?', sql)
+    sql = _IN_LIST.sub('IN (...)', sql)
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+def fingerprint(sql):
+    return hashlib.md5(normalize(sql).encode()).hexdigest()[:12]
+
+
+def view_name(request):
+    """Dotted path of the view handling ``request``, or None before URL resolution"""
+    resolver_match = getattr(request, 'resolver_match', None)
+    if resolver_match is None:
+        return None
+    func = resolver_match.func
+    return f'{func.__module__}.{getattr(func, "__name__", func.__class__.__name__)}'
+
+
+def _is_watched(view):
+    if view is None:
+        return False
+    return any(view.startswith(module) for module in _setting('SLOW_QUERY_MODULES', ['core.views']))
+
+
+def explaining():
+    """Whether the current thread is running EXPLAIN for a slow query"""
+    return _explaining.get()
+
+
+def explain(connection, sql, params):
+    """Query plan for ``sql`` as text, following SLOW_QUERY_EXPLAIN"""
+    mode = _setting('SLOW_QUERY_EXPLAIN', 'plan')
+    if mode == 'off':
+        return None
+    analyze = mode == 'analyze' and sql.lstrip()[:6].upper() == 'SELECT'
+
+    try:
+        try:
+            prefix = connection.ops.explain_query_prefix(analyze=True) if analyze else connection.ops.explain_query_prefix()
+        except ValueError:
+            # Backend has no EXPLAIN ANALYZE
+            prefix = connection.ops.explain_query_prefix()
+        token = _explaining.set(True)
+        try:
+            # A savepoint, so a failed EXPLAIN cannot abort the request's transaction
+            # (PostgreSQL refuses every later query in an aborted transaction)
+            with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+                cursor.execute(f'{prefix} {sql}', params)
+                rows = cursor.fetchall()
+        finally:
+            _explaining.reset(token)
+    except Exception as exc:
+        return f'EXPLAIN failed: {exc.__class__.__name__}: {exc}'
+    return '\n'.join(' '.join(str(column) for column in row) for row in rows)
+
+
+def capture(connection, sql, params, many, duration_ms, request):
+    """Log a slow query if it comes from a watched view and is not rate limited"""
+    if _explaining.get() or duration_ms < _setting('SLOW_QUERY_THRESHOLD_MS', 100):
+        return False
+    view = view_name(request)
+    if not _is_watched(view):
+        return False
+
+    query_fingerprint = fingerprint(sql)
+    interval = _setting('SLOW_QUERY_LOG_INTERVAL', 60)
+    if interval and not caches['default'].add(f'core:slow-query:{query_fingerprint}', 1, interval):
+        return False
+
+    logger.warning(
+        'Slow query %s (%.1f ms) in %s',
+        query_fingerprint, duration_ms, view,
+        extra={
+            'fingerprint': query_fingerprint,
+            'duration_ms': round(duration_ms, 2),
+            'view': view,
+            'sql': sql,
+            'normalized_sql': normalize(sql),
+            'params': str(params),
+            # executemany() batches have no single plan
+            'plan': None if many else explain(connection, sql, params),
+        },
+    )
+    return True
@@ -0,0 +1,245 @@
+"""
+Spam scoring for contact form messages.
+
+A message's score is the sum of weighted features:
+
+- phrases: each distinct phrase from ``PHRASES_FILE`` found in the message,
+  matched as whole words by one compiled regular expression, whatever the
+  length of the list; the file is reloaded when it changes
+- links: every URL beyond ``FREE_LINKS``, plus a flat amount when URLs make
+  up more than ``MAX_LINK_DENSITY`` of the text
+- repetition: the same few words repeated over and over
+- naive Bayes (optional, ``BAYES``): a model trained on the contacts marked
+  as spam or not spam in the admin, counted when it is at least
+  ``BAYES_THRESHOLD`` sure the message is spam
+
+Messages scoring ``THRESHOLD`` or more are spam. With the defaults two
+phrases, four extra links or a confident model are each enough on their own.
+
+Configured by ``settings.SPAM_FILTER``; the trained model is kept in the
+cache so every worker uses the same one.
+"""
+import math
+import re
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .reloadable import ReloadingFile, data_lines
+
+DEFAULTS = {
+    'PHRASES_FILE': settings.BASE_DIR / 'core' / 'data' / 'spam_phrases.txt',
+    'RELOAD_INTERVAL': 30,
+    'THRESHOLD': 1.0,
+    'PHRASE_WEIGHT': 0.5,
+    'FREE_LINKS': 1,
+    'LINK_WEIGHT': 0.25,
+    'MAX_LINK_DENSITY': 0.3,
+    'LINK_DENSITY_WEIGHT': 0.5,
+    'MIN_REPETITION_WORDS': 12,
+    'MAX_REPETITION': 0.6,
+    'REPETITION_WEIGHT': 0.5,
+    'BAYES': False,
+    'BAYES_THRESHOLD': 0.9,
+    'BAYES_WEIGHT': 1.0,
+    'BAYES_MIN_SAMPLES': 20,
+    'BAYES_MAX_FEATURES': 5000,
+    'CACHE_ALIAS': 'default',
+}
+
+MODEL_CACHE_KEY = 'core:spam:bayes'
+
+# Trailing punctuation belongs to the sentence, not the URL
+URL_RE = re.compile(r'(?:https?://|www\.)[^\s<>"]*[^\s<>".,;:!?)\]]', re.IGNORECASE)
+WORD_RE = re.compile(r"[a-z0-9']+")
+TOKEN_RE = re.compile(r"[a-z0-9']{2,}")
+
+_lock = threading.Lock()
+_phrases = None
+_model = None
+_model_checked_at = None
+
+
+def spam_settings():
+    return {**DEFAULTS, **getattr(settings, 'SPAM_FILTER', {})}
+
+
+class PhraseMatcher:
+    """Finds any of ``phrases`` in a text with a single regex scan"""
+
+    def __init__(self, phrases):
+        self.phrases = sorted({' '.join(phrase.lower().split()) for phrase in phrases}, key=len, reverse=True)
+        self.pattern = None
+        if self.phrases:
+            alternatives = '|'.join(r'\s+'.join(map(re.escape, phrase.split())) for phrase in self.phrases)
+            self.pattern = re.compile(rf'(?<!\w)(?:{alternatives})(?!\w)', re.IGNORECASE)
+
+    @classmethod
+    def from_text(cls, text):
+        return cls(data_lines(text))
+
+    def matches(self, text):
+        """The distinct phrases found in ``text``"""
+        if self.pattern is None:
+            return set()
+        return {' '.join(match.lower().split()) for match in self.pattern.findall(text)}
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(URL_RE.sub(' httpurl ', text.lower()))
+
+
+class NaiveBayes:
+    """
+    Bernoulli-style naive Bayes over the tokens of a message: counts are the
+    number of training messages each token appears in, with Laplace smoothing.
+    """
+
+    def __init__(self, spam_counts, ham_counts, spam_docs, ham_docs):
+        self.spam_counts = spam_counts
+        self.ham_counts = ham_counts
+        self.spam_docs = spam_docs
+        self.ham_docs = ham_docs
+        self.log_prior = math.log(spam_docs / ham_docs)
+
+    @classmethod
+    def train(cls, spam_texts, ham_texts, max_features=5000):
+        spam_counts = Counter(token for text in spam_texts for token in set(tokenize(text)))
+        ham_counts = Counter(token for text in ham_texts for token in set(tokenize(text)))
+        # The most frequent tokens carry nearly all the signal and bound the model's size
+        vocabulary = {token for token, _ in (spam_counts + ham_counts).most_common(max_features)}
+        return cls(
+            {token: count for token, count in spam_counts.items() if token in vocabulary},
+            {token: count for token, count in ham_counts.items() if token in vocabulary},
+            len(spam_texts),
+            len(ham_texts),
+        )
+
+    def spam_probability(self, text):
+        log_odds = self.log_prior
+        for token in set(tokenize(text)):
+            spam = self.spam_counts.get(token, 0)
+            ham = self.ham_counts.get(token, 0)
+            if spam or ham:
+                log_odds += math.log((spam + 1) / (self.spam_docs + 2)) - math.log((ham + 1) / (self.ham_docs + 2))
+        log_odds = max(min(log_odds, 700), -700)
+        return 1 / (1 + math.exp(-log_odds))
+
+    def to_dict(self):
+        return {
+            'spam_counts': self.spam_counts,
+            'ham_counts': self.ham_counts,
+            'spam_docs': self.spam_docs,
+            'ham_docs': self.ham_docs,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+class SpamScore:
+    """A message's spam score and the features that made it up"""
+
+    def __init__(self, score, threshold, features):
+        self.score = score
+        self.threshold = threshold
+        self.features = features
+
+    @property
+    def is_spam(self):
+        return self.score >= self.threshold
+
+    def __repr__(self):
+        return f'<SpamScore {self.score:.2f}/{self.threshold:.2f} {self.features}>'
+
+
+def phrase_matcher():
+    """The matcher for ``PHRASES_FILE``, reloaded when the file changes"""
+    global _phrases
+    if _phrases is None:
+        with _lock:
+            if _phrases is None:
+                config = spam_settings()
+                _phrases = ReloadingFile(config['PHRASES_FILE'], PhraseMatcher.from_text, config['RELOAD_INTERVAL'])
+    return _phrases.value
+
+
+def bayes_model():
+    """The trained model from the cache, checked at most every ``RELOAD_INTERVAL`` seconds"""
+    global _model, _model_checked_at
+    config = spam_settings()
+    now = time.monotonic()
+    if _model_checked_at is None or now - _model_checked_at >= config['RELOAD_INTERVAL']:
+        data = caches[config['CACHE_ALIAS']].get(MODEL_CACHE_KEY)
+        _model = NaiveBayes.from_dict(data) if data else None
+        _model_checked_at = now
+    return _model
+
+
+def train():
+    """
+    Train the naive Bayes model on contacts marked as spam and not spam and
+    share it through the cache. Returns the model, or None (and drops the old
+    one) while either side has fewer than ``BAYES_MIN_SAMPLES`` contacts.
+    """
+    global _model, _model_checked_at
+    from .models import Contact
+
+    config = spam_settings()
+    texts = {True: [], False: []}
+    for subject, message, is_spam in Contact.objects.values_list('subject', 'message', 'is_spam').iterator():
+        texts[is_spam].append(f'{subject} {message}')
+
+    cache = caches[config['CACHE_ALIAS']]
+    if min(len(texts[True]), len(texts[False])) < config['BAYES_MIN_SAMPLES']:
+        model = None
+        cache.delete(MODEL_CACHE_KEY)
+    else:
+        model = NaiveBayes.train(texts[True], texts[False], config['BAYES_MAX_FEATURES'])
+        cache.set(MODEL_CACHE_KEY, model.to_dict(), None)
+    _model, _model_checked_at = model, time.monotonic()
+    return model
+
+
+def score(message):
+    """Score ``message``; ``score(message).is_spam`` tells whether to reject it"""
+    config = spam_settings()
+    features = {}
+
+    phrases = phrase_matcher().matches(message)
+    if phrases:
+        features['phrases'] = config['PHRASE_WEIGHT'] * len(phrases)
+
+    urls = URL_RE.findall(message)
+    if len(urls) > config['FREE_LINKS']:
+        features['links'] = config['LINK_WEIGHT'] * (len(urls) - config['FREE_LINKS'])
+    if urls and sum(map(len, urls)) / len(message) > config['MAX_LINK_DENSITY']:
+        features['link_density'] = config['LINK_DENSITY_WEIGHT']
+
+    words = WORD_RE.findall(message.lower())
+    if len(words) >= config['MIN_REPETITION_WORDS']:
+        repetition = 1 - len(set(words)) / len(words)
+        if repetition > config['MAX_REPETITION']:
+            features['repetition'] = config['REPETITION_WEIGHT']
+
+    if config['BAYES']:
+        model = bayes_model()
+        if model is not None and model.spam_probability(message) >= config['BAYES_THRESHOLD']:
+            features['bayes'] = config['BAYES_WEIGHT']
+
+    return SpamScore(sum(features.values()), config['THRESHOLD'], features)
+
+
+@receiver(setting_changed)
+def reset_spam_filter(setting, **kwargs):
+    global _phrases, _model, _model_checked_at
+    if setting == 'SPAM_FILTER':
+        with _lock:
+            _phrases = None
+            _model = _model_checked_at = None
@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import views, metrics
 
 urlpatterns = [
     path('', views.index, name='index'),
@@ -12,4 +12,7 @@ urlpatterns = [
     # API endpoints
     path('api/skills/', views.api_skills, name='api_skills'),
     path('api/projects/', views.api_projects, name='api_projects'),
+    
+    # Prometheus scrape endpoint
+    path('metrics', metrics.metrics_view, name='metrics'),
 ]
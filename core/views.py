@@ -3,40 +3,50 @@ from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Count
 from django.utils import timezone
 from datetime import timedelta
+from .forms import ContactForm
 from .models import Profile, Skill, Project, Experience, Education, Certification, Contact
 from .services import NotificationService
-import json
+from .notifications import channel_names, get_channel
+from .notifications.stats import delivery_stats
+from .cache import get_or_regenerate
+from .metrics import observe_contact_duplicate
+
+
+def _profile():
+    return get_or_regenerate('profile', Profile.objects.first)
 
 
 def index(request):
     """Home page view"""
-    context = {
-        'profile': Profile.objects.first(),
-        'featured_projects': Project.objects.filter(featured=True)[:3] if Project.objects.filter(featured=True).exists() else [],
-        'skills': Skill.objects.filter(featured=True)[:8] if Skill.objects.filter(featured=True).exists() else [],
+    context = dict(get_or_regenerate('index', lambda: {
+        'featured_projects': list(Project.objects.filter(featured=True)[:3]),
+        'skills': list(Skill.objects.filter(featured=True)[:8]),
         'project_count': Project.objects.count(),
         'certification_count': Certification.objects.count(),
-    }
+    }))
+    context['profile'] = _profile()
     return render(request, 'core/index.html', context)
 
 
 def about(request):
     """About page view"""
-    context = {
-        'profile': Profile.objects.first(),
-        'skills': Skill.objects.all(),
-        'education': Education.objects.all(),
-        'certifications': Certification.objects.all(),
-    }
+    context = dict(get_or_regenerate('about', lambda: {
+        'skills': list(Skill.objects.all()),
+        'education': list(Education.objects.all()),
+        'certifications': list(Certification.objects.all()),
+    }))
+    context['profile'] = _profile()
     return render(request, 'core/about.html', context)
 
 
 def projects(request):
     """Projects page view"""
-    projects_list = Project.objects.all()
+    projects_list = Project.objects.prefetch_related('technologies')
     
     # Filter by category if provided
     category = request.GET.get('category')
@@ -51,6 +61,10 @@ def projects(request):
         ) | projects_list.filter(
             description__icontains=search
         )
+    elif not category or category == 'all' or category in dict(Project.CATEGORY_CHOICES):
+        # Unsearched listings are a handful of fixed pages, so cache them
+        queryset = projects_list
+        projects_list = get_or_regenerate(f'projects:{category or "all"}', lambda: list(queryset))
     
     context = {
         'projects': projects_list,
@@ -70,21 +84,52 @@ def project_detail(request, pk):
     return render(request, 'core/project_detail.html', context)
 
 
+def _duplicate_key(fingerprint):
+    return f'core:contact:{fingerprint}'
+
+
+def _is_duplicate_submission(fingerprint):
+    """
+    Whether a contact with this fingerprint arrived within
+    CONTACT_DUPLICATE_WINDOW seconds. The cache marker catches concurrent
+    resubmits across workers; the indexed lookup covers submissions the
+    cache no longer remembers.
+    """
+    window = settings.CONTACT_DUPLICATE_WINDOW
+    if not window:
+        return False
+    if not cache.add(_duplicate_key(fingerprint), 1, window):
+        return True
+    since = timezone.now() - timedelta(seconds=window)
+    return Contact.objects.filter(fingerprint=fingerprint, created_at__gte=since).exists()
+
+
 def contact(request):
     """Contact page view"""
+    form = ContactForm(request.POST or None)
     if request.method == 'POST':
-        name = request.POST.get('name')
-        email = request.POST.get('email')
-        subject = request.POST.get('subject')
-        message = request.POST.get('message')
+        # Invalid and spam submissions are turned away before anything is saved
+        if not form.is_valid():
+            return render(request, 'core/contact.html', {'profile': _profile(), 'form': form})
         
-        # Save contact submission
-        contact_obj = Contact.objects.create(
-            name=name,
-            email=email,
-            subject=subject,
-            message=message
+        # Refresh-resubmits and bots get the usual thank-you without a second contact or notification
+        fingerprint = Contact.content_fingerprint(
+            form.cleaned_data['email'], form.cleaned_data['subject'], form.cleaned_data['message'],
         )
+        if _is_duplicate_submission(fingerprint):
+            observe_contact_duplicate()
+            messages.success(request, 'Thank you for your message! I will get back to you soon.')
+            return redirect('contact')
+        
+        # Save contact submission
+        contact_obj = form.save(commit=False)
+        contact_obj.fingerprint = fingerprint
+        try:
+            contact_obj.save()
+        except Exception:
+            # Nothing was stored, so the sender's retry must not count as a duplicate
+            cache.delete(_duplicate_key(fingerprint))
+            raise
         
         # Send notifications
         try:
@@ -105,7 +150,8 @@ def contact(request):
         return redirect('contact')
     
     context = {
-        'profile': Profile.objects.first(),
+        'profile': _profile(),
+        'form': form,
     }
     return render(request, 'core/contact.html', context)
 
@@ -139,6 +185,13 @@ def dashboard(request):
         })
     daily_contacts.reverse()
     
+    # Circuit breaker state of every notification provider
+    breakers = {}
+    for name in channel_names():
+        breaker = get_channel(name).breaker
+        if breaker is not None:
+            breakers.setdefault(breaker.provider, breaker)
+    
     context = {
         'total_contacts': total_contacts,
         'unread_contacts': unread_contacts,
@@ -147,6 +200,9 @@ def dashboard(request):
         'month_contacts': month_contacts,
         'recent_contacts': recent_contacts,
         'daily_contacts': daily_contacts,
+        'notification_providers': [breaker.status() for breaker in breakers.values()],
+        'deferred_notifications': Contact.objects.exclude(pending_notifications=[]).count(),
+        'delivery_stats': delivery_stats(days=7),
     }
     return render(request, 'core/dashboard.html', context)
 
@@ -155,17 +211,17 @@ def dashboard(request):
 @csrf_exempt
 def api_skills(request):
     """API endpoint for skills"""
-    skills = Skill.objects.all().values(
+    skills = get_or_regenerate('api:skills', lambda: list(Skill.objects.all().values(
         'id', 'name', 'category', 'proficiency', 'icon', 'featured'
-    )
-    return JsonResponse(list(skills), safe=False)
+    )))
+    return JsonResponse(skills, safe=False)
 
 
 @csrf_exempt
 def api_projects(request):
     """API endpoint for projects"""
-    projects = Project.objects.all().values(
+    projects = get_or_regenerate('api:projects', lambda: list(Project.objects.all().values(
         'id', 'title', 'description', 'category', 
         'github_url', 'live_url', 'featured', 'completed_date'
-    )
-    return JsonResponse(list(projects), safe=False)
+    )))
+    return JsonResponse(projects, safe=False)
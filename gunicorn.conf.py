@@ -0,0 +1,135 @@
+"""
+Gunicorn configuration for portfolio_django.
+
+``manage.py start`` runs gunicorn in-process with ``--preload`` and this
+file. Workers and threads are sized from the CPUs and memory actually
+available to the container (cgroup v1/v2 limits, not the host's), and every
+value can be overridden through ``GUNICORN_*`` environment variables:
+
+- ``GUNICORN_WORKER_CLASS``: ``sync`` (default) or ``gthread``, which keeps
+  a worker responsive while threads wait on SMTP/Twilio calls
+- ``GUNICORN_WORKERS`` / ``GUNICORN_THREADS``: explicit pool sizes
+- ``GUNICORN_WORKER_MEMORY_MB``: expected resident size of one worker, used
+  to cap the worker count under the memory limit
+- ``GUNICORN_TIMEOUT``, ``GUNICORN_MAX_REQUESTS``, ``GUNICORN_MAX_REQUESTS_JITTER``
+"""
+import math
+import os
+import time
+
+
+def _env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _read(path):
+    try:
+        with open(path) as limit_file:
+            return limit_file.read().strip()
+    except OSError:
+        return None
+
+
+def available_cpus():
+    """CPUs this process may use, honouring affinity and cgroup CPU quotas"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    quota = period = None
+    cpu_max = _read('/sys/fs/cgroup/cpu.max')  # cgroup v2: "<quota|max> <period>"
+    if cpu_max:
+        quota, period = cpu_max.split()
+    else:  # cgroup v1
+        quota, period = _read('/sys/fs/cgroup/cpu/cpu.cfs_quota_us'), _read('/sys/fs/cgroup/cpu/cpu.cfs_period_us')
+    try:
+        if quota not in (None, 'max', '-1') and period:
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except ValueError:
+        pass
+    return cpus
+
+
+def available_memory():
+    """Bytes of memory available to this container, or None when unknown"""
+    physical = None
+    try:
+        physical = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (ValueError, OSError, AttributeError):
+        pass
+
+    limit = _read('/sys/fs/cgroup/memory.max') or _read('/sys/fs/cgroup/memory/memory.limit_in_bytes')
+    if limit and limit != 'max':
+        try:
+            limit = int(limit)
+        except ValueError:
+            return physical
+        # cgroup v1 reports "unlimited" as a huge number
+        if physical is None or limit < physical:
+            return limit
+    return physical
+
+
+def worker_count(cpus, memory_bytes, worker_memory_mb, worker_class):
+    """(2 x CPUs) + 1 sync workers, CPUs + 1 for gthread, capped by memory"""
+    workers = cpus + 1 if worker_class == 'gthread' else 2 * cpus + 1
+    if memory_bytes:
+        workers = min(workers, memory_bytes // (worker_memory_mb * 1024 * 1024))
+    return max(1, workers)
+
+
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+workers = _env_int('GUNICORN_WORKERS', worker_count(
+    available_cpus(), available_memory(), _env_int('GUNICORN_WORKER_MEMORY_MB', 150), worker_class,
+))
+threads = _env_int('GUNICORN_THREADS', 4 if worker_class == 'gthread' else 1)
+timeout = _env_int('GUNICORN_TIMEOUT', 120)
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers periodically to cap memory growth; jitter keeps them from
+# all restarting at once
+max_requests = _env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = _env_int('GUNICORN_MAX_REQUESTS_JITTER', 100)
+
+# Heartbeat files on tmpfs: a slow or full disk must not make workers look dead
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+
+def _worker_event(event):
+    from core.metrics import observe_worker_event
+    observe_worker_event(event)
+
+
+def when_ready(server):
+    """Log the cold start and the pool size chosen for this host"""
+    server.log.info(
+        'Using %d %s worker(s) with %d thread(s) each', workers, worker_class, threads,
+    )
+    started_at = os.environ.get('STARTUP_STARTED_AT')
+    if started_at:
+        server.log.info('Cold start took %.0f ms', (time.time() - float(started_at)) * 1000)
+    if server.cfg.preload_app:
+        # Parse the email domain blocklists once, before forking, so workers share them
+        from core.blocklist import blocklists
+        blocklists()
+
+
+def post_fork(server, worker):
+    _worker_event('boot')
+
+
+def worker_abort(worker):
+    # Called in the worker when the arbiter kills it for missing the timeout
+    _worker_event('timeout')
+
+
+def child_exit(server, worker):
+    """Count the exit and drop the worker's live samples from the Prometheus directory"""
+    _worker_event('exit')
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
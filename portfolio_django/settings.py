@@ -37,18 +37,21 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
-    'rest_framework',
     'corsheaders',
+    'cacheops',
     'core',
 ]
 
 MIDDLEWARE = [
+    # Answers /healthz and /readyz before anything else runs
+    'core.health.HealthCheckMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.instrumentation.PerformanceMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -57,7 +60,8 @@ ROOT_URLCONF = 'portfolio_django.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates that reports render time to core.instrumentation
+        'BACKEND': 'core.instrumentation.InstrumentedDjangoTemplates',
         'DIRS': [],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -166,3 +170,119 @@ RECIPIENT_PHONE_NUMBER = os.getenv('YOUR_PHONE_NUMBER', '+919936057425')
 # Notification Settings
 ENABLE_EMAIL_NOTIFICATIONS = True
 ENABLE_SMS_NOTIFICATIONS = True
+
+# Channels used for contact submissions (see core.notifications); each backend
+# is imported on first use. Also available: core.notifications.console.ConsoleChannel,
+# core.notifications.file.FileChannel (OPTIONS: PATH) and
+# core.notifications.locmem.InMemoryChannel.
+NOTIFICATION_CHANNELS = {
+    'email': {
+        'BACKEND': 'core.notifications.email.EmailChannel',
+        'OPTIONS': {'SITE_NAME': 'Siddharth Portfolio'},
+    },
+    'sms': {
+        'BACKEND': 'core.notifications.sms.TwilioSMSChannel',
+    },
+}
+
+# Per-provider circuit breakers (core.notifications.breaker), shared by every
+# worker through the cache: FAILURE_THRESHOLD consecutive failures within
+# FAILURE_WINDOW seconds stop sends to the provider for COOLDOWN seconds. Skipped
+# notifications are retried by the send_deferred_notifications command.
+NOTIFICATION_CIRCUIT_BREAKER = {
+    'FAILURE_THRESHOLD': int(os.getenv('NOTIFICATION_BREAKER_THRESHOLD', 5)),
+    'FAILURE_WINDOW': 300,
+    'COOLDOWN': int(os.getenv('NOTIFICATION_BREAKER_COOLDOWN', 60)),
+}
+
+# Owner notifications (email and SMS) arriving within this many seconds of
+# the last one sent are coalesced into one digest; 0 sends each one. Run the
+# send_notification_digests command every minute or so when this is on.
+# Submitter confirmations are always sent individually.
+NOTIFICATION_DIGEST_WINDOW = int(os.getenv('NOTIFICATION_DIGEST_WINDOW', 0))
+
+# At most one confirmation email per sender address (case-insensitive,
+# ignoring +tags) within this many seconds; 0 confirms every submission
+NOTIFICATION_CONFIRMATION_WINDOW = int(os.getenv('NOTIFICATION_CONFIRMATION_WINDOW', 600))
+
+# A contact submission with the same email, subject and message (ignoring case
+# and whitespace) as one within this many seconds is dropped before it is saved
+# or notified, and the sender sees the usual thank-you; 0 accepts every one
+CONTACT_DUPLICATE_WINDOW = int(os.getenv('CONTACT_DUPLICATE_WINDOW', 3600))
+
+# Contact message spam scoring (see core.spam). PHRASES_FILE is reloaded by
+# running workers when it changes. With BAYES on, a naive Bayes model trained
+# on the contacts marked as spam in the admin (or by the train_spam_filter
+# command) also counts towards the score.
+SPAM_FILTER = {
+    'PHRASES_FILE': BASE_DIR / 'core' / 'data' / 'spam_phrases.txt',
+    'THRESHOLD': 1.0,
+    'BAYES': os.getenv('SPAM_FILTER_BAYES', 'False').lower() in ('1', 'true', 'yes'),
+}
+
+# Email domains the contact form turns away (see core.blocklist). Each file is
+# reloaded by running workers when it changes. disposable_domains.txt is the
+# hand-picked list; the upstream file is filled and refreshed by
+# "manage.py update_disposable_domains".
+EMAIL_DOMAIN_BLOCKLIST = {
+    'FILES': [
+        BASE_DIR / 'core' / 'data' / 'disposable_domains.txt',
+        BASE_DIR / 'core' / 'data' / 'disposable_domains_upstream.txt',
+    ],
+    'RELOAD_INTERVAL': 30,
+}
+
+# Page data caching (see core.cache.get_or_regenerate)
+# Entries are fresh for VIEW_CACHE_TIMEOUT seconds, then served stale for up to
+# VIEW_CACHE_STALE_WHILE_REVALIDATE seconds while a single request rebuilds them.
+VIEW_CACHE_TIMEOUT = int(os.getenv('VIEW_CACHE_TIMEOUT', 300))
+VIEW_CACHE_STALE_WHILE_REVALIDATE = int(os.getenv('VIEW_CACHE_STALE_WHILE_REVALIDATE', 60))
+VIEW_CACHE_EARLY_REFRESH_BETA = float(os.getenv('VIEW_CACHE_EARLY_REFRESH_BETA', 1.0))
+VIEW_CACHE_LOCK_TIMEOUT = int(os.getenv('VIEW_CACHE_LOCK_TIMEOUT', 10))
+
+# Per-request performance instrumentation (see core.instrumentation)
+# Fraction of requests measured and logged; staff requests are always measured.
+PERFORMANCE_SAMPLE_RATE = float(os.getenv('PERFORMANCE_SAMPLE_RATE', 1.0))
+
+# Readiness probe (see core.health): seconds a /readyz result is reused
+READINESS_CACHE_SECONDS = int(os.getenv('READINESS_CACHE_SECONDS', 5))
+
+# Prometheus metrics (see core.metrics)
+# /metrics is open to staff users, METRICS_ALLOWED_IPS and requests carrying
+# "Authorization: Bearer <METRICS_TOKEN>".
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True').lower() in ('1', 'true', 'yes')
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+METRICS_ALLOWED_IPS = ['127.0.0.1', '::1']
+
+# Slow query log (see core.slow_queries)
+# SLOW_QUERY_EXPLAIN is 'off', 'plan' or 'analyze' (EXPLAIN ANALYZE, SELECTs only)
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv('SLOW_QUERY_THRESHOLD_MS', 100))
+SLOW_QUERY_EXPLAIN = os.getenv('SLOW_QUERY_EXPLAIN', 'plan')
+SLOW_QUERY_LOG_INTERVAL = int(os.getenv('SLOW_QUERY_LOG_INTERVAL', 60))
+SLOW_QUERY_MODULES = ['core.views', 'django.contrib.admin']
+SLOW_QUERY_LOG_FILE = BASE_DIR / 'logs' / 'slow_queries.log'
+
+# ORM queryset caching (django-cacheops)
+# Off unless CACHEOPS_ENABLED is set, so local runs and tests never need Redis.
+# Writes, including technologies M2M changes, invalidate affected querysets.
+CACHEOPS_ENABLED = os.getenv('CACHEOPS_ENABLED', 'False').lower() in ('1', 'true', 'yes')
+CACHEOPS_REDIS = os.getenv('REDIS_URL', 'redis://localhost:6379/1')
+CACHEOPS_DEGRADE_ON_FAILURE = True
+
+# Per-model TTLs in seconds
+CACHEOPS_TIMEOUTS = {
+    'core.profile': 60 * 60,
+    'core.skill': 60 * 60,
+    'core.project': 60 * 60,
+    'core.experience': 60 * 60 * 24,
+    'core.education': 60 * 60 * 24,
+    'core.certification': 60 * 60 * 24,
+}
+CACHEOPS = {
+    model: {'ops': 'all', 'timeout': timeout}
+    for model, timeout in CACHEOPS_TIMEOUTS.items()
+}
+# Auto-created technologies through tables; contact submissions are never cached
+CACHEOPS['core.*'] = {'ops': 'all', 'timeout': 60 * 60}
+CACHEOPS['core.contact'] = None
+CACHEOPS['core.notificationdelivery'] = None
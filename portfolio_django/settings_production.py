@@ -126,65 +126,101 @@ TWILIO_PHONE_NUMBER = os.environ.get('TWILIO_PHONE_NUMBER')
 RECIPIENT_PHONE_NUMBER = os.environ.get('YOUR_PHONE_NUMBER')
 
 # Logging Configuration
+# Request threads only enqueue records; a listener thread per handler and
+# worker writes them as JSON lines (with request id and view) to size-rotated
+# files, which the workers rotate in turn under a lock file, and stderr. A
+# full queue drops records, INFO first, instead of blocking requests.
+LOG_QUEUE_SIZE = int(os.environ.get('LOG_QUEUE_SIZE', 10000))
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
-    'formatters': {
-        'verbose': {
-            'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
-            'style': '{',
-        },
-        'simple': {
-            'format': '{levelname} {message}',
-            'style': '{',
-        },
-    },
     'handlers': {
-        'file': {
+        'queue': {
             'level': 'INFO',
-            'class': 'logging.FileHandler',
+            'class': 'core.log.QueueFileHandler',
             'filename': BASE_DIR / 'logs' / 'django.log',
-            'formatter': 'verbose',
+            'maxBytes': 20 * 1024 * 1024,
+            'backupCount': 5,
+            'queue_size': LOG_QUEUE_SIZE,
+            'drop_level': 'INFO',
+            'console': True,
         },
-        'console': {
-            'level': 'INFO',
-            'class': 'logging.StreamHandler',
-            'formatter': 'simple',
+        # Read by the slow_queries management command
+        'slow_queries': {
+            'level': 'WARNING',
+            'class': 'core.log.QueueFileHandler',
+            'filename': SLOW_QUERY_LOG_FILE,
+            'maxBytes': 10 * 1024 * 1024,
+            'backupCount': 3,
+            'queue_size': 1000,
         },
     },
     'root': {
-        'handlers': ['console', 'file'],
+        'handlers': ['queue'],
         'level': 'INFO',
     },
     'loggers': {
         'django': {
-            'handlers': ['console', 'file'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
         'core': {
-            'handlers': ['console', 'file'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
+        'core.slow_queries': {
+            'handlers': ['queue', 'slow_queries'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
     },
 }
 
+# Only measure a sample of anonymous requests; staff always get Server-Timing
+PERFORMANCE_SAMPLE_RATE = float(os.environ.get('PERFORMANCE_SAMPLE_RATE', 0.1))
+
+# Prometheus metrics
+# Behind the same-host proxy every request comes from 127.0.0.1, so no address
+# is trusted by default: scrapers must send "Authorization: Bearer <METRICS_TOKEN>".
+# METRICS_ALLOWED_IPS (comma-separated) only helps when REMOTE_ADDR is the real client.
+METRICS_ALLOWED_IPS = [ip.strip() for ip in os.environ.get('METRICS_ALLOWED_IPS', '').split(',') if ip.strip()]
+if METRICS_ENABLED and not METRICS_TOKEN:
+    METRICS_ENABLED = False
+    import warnings
+    warnings.warn(
+        "METRICS_TOKEN not set in environment! Prometheus metrics are disabled. "
+        "Set METRICS_TOKEN in Render and configure it as the scraper's bearer token.",
+        UserWarning
+    )
+
 # Cache Configuration
 # Use Redis if available, otherwise fallback to in-memory cache
 REDIS_URL = os.environ.get('REDIS_URL')
 if REDIS_URL and REDIS_URL.startswith('redis://'):
+    # Hot keys are served from a small per-worker LRU before going to Redis.
+    # LOCAL_TIMEOUT bounds how stale a worker can be after another one writes.
     CACHES = {
         'default': {
+            'BACKEND': 'core.cache.TieredCache',
+            'LOCATION': 'redis',
+            'OPTIONS': {
+                'LOCAL_MAX_ENTRIES': int(os.environ.get('CACHE_LOCAL_MAX_ENTRIES', 1000)),
+                'LOCAL_TIMEOUT': int(os.environ.get('CACHE_LOCAL_TIMEOUT', 5)),
+            }
+        },
+        'redis': {
             'BACKEND': 'django.core.cache.backends.redis.RedisCache',
             'LOCATION': REDIS_URL,
             'OPTIONS': {
                 'CLIENT_CLASS': 'django_redis.client.DefaultClient',
             }
-        }
+        },
     }
     SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
-    SESSION_CACHE_ALIAS = 'default'
+    # Sessions bypass the local tier so logins/logouts are visible to every worker at once
+    SESSION_CACHE_ALIAS = 'redis'
 else:
     # Fallback to in-memory cache if Redis isn't available
     CACHES = {
@@ -202,10 +238,16 @@ else:
         UserWarning
     )
 
+# ORM queryset caching shares the Redis instance when one is configured
+CACHEOPS_ENABLED = bool(REDIS_URL and REDIS_URL.startswith('redis://'))
+if CACHEOPS_ENABLED:
+    CACHEOPS_REDIS = REDIS_URL
+
 # Rate Limiting
 # Only enable if cache is properly configured (Redis)
 RATELIMIT_ENABLE = bool(REDIS_URL and REDIS_URL.startswith('redis://'))
-RATELIMIT_USE_CACHE = 'default'
+# Counters go straight to Redis; the per-worker tier would hide other workers' hits
+RATELIMIT_USE_CACHE = 'redis' if RATELIMIT_ENABLE else 'default'
 
 # File Upload Security
 FILE_UPLOAD_MAX_MEMORY_SIZE = 5242880  # 5MB
@@ -1,34 +1,12 @@
 #!/bin/bash
 set -e
 
-echo "Running database migrations..."
-python manage.py migrate --noinput
-
-echo "Checking if database needs initial data..."
-# Check if Profile table exists and has data, populate if empty
-python << EOF
-import os
-import django
-import sys
-
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_django.settings_production')
-django.setup()
-
-from core.models import Profile
-
-if Profile.objects.count() == 0:
-    print('Database is empty. Populating with initial data...')
-    from django.core.management import call_command
-    try:
-        call_command('populate_fresher_data')
-        print('Successfully populated database with initial data!')
-    except Exception as e:
-        print(f'Warning: Failed to populate data: {e}')
-        print('You can run "python manage.py populate_fresher_data" manually.')
-else:
-    print('Database already has data. Skipping population.')
-EOF
-
-echo "Starting Gunicorn..."
-exec gunicorn --bind 0.0.0.0:8000 --workers 3 --timeout 120 portfolio_django.wsgi:application
-
+# Workers write Prometheus samples here so /metrics aggregates all of them;
+# start from an empty directory so samples from previous runs are not counted
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus}"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
+# Migrations, initial data, cache warmup and gunicorn (with --preload) all run
+# in one interpreter; see core/management/commands/start.py
+exec python manage.py start -- --config gunicorn.conf.py